@@ -1,9 +1,11 @@
 """Helpers for resolving asset paths in development and bundled builds."""
 
+from functools import lru_cache
 from pathlib import Path
 import sys
 
 
+@lru_cache(maxsize=1)
 def _base_dir() -> Path:
     """Return the app base directory (supports PyInstaller)."""
     if hasattr(sys, "_MEIPASS"):
@@ -11,5 +13,6 @@ def _base_dir() -> Path:
     return Path(__file__).resolve().parent.parent
 
 
+@lru_cache(maxsize=128)
 def asset_path(*parts: str) -> Path:
     return _base_dir().joinpath("assets", *parts)
@@ -4,6 +4,7 @@ import json
 import logging
 import shutil
 import threading
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, Optional
@@ -13,6 +14,8 @@ from core.app_config import AppConfig
 from core.lemonfox_client import LemonFoxClient
 
 logger = logging.getLogger(__name__)
+
+VAD_CHUNK_QUEUE_LIMIT = 16
 
 
 class TranscriptionService:
@@ -32,6 +35,7 @@ class TranscriptionService:
         self.client = LemonFoxClient(config=config)
         self.recorder = None  # Lazy-loaded (needs PortAudio)
         self._vad = None
+        self._vad_lock = threading.RLock()
         self._on_transcription = on_transcription
         self._on_error = on_error
         self._recovery_root = Path(__file__).resolve().parent.parent / "data" / "failed_stt"
@@ -41,6 +45,13 @@ class TranscriptionService:
         self._last_failed_audio: bytes = b""
         self._last_failed_file_path = ""
         self._last_failed_source = ""
+        # VAD thread only appends here; a single worker drains and transcribes.
+        self._vad_chunks: deque[bytes] = deque(maxlen=VAD_CHUNK_QUEUE_LIMIT)
+        # Chunks evicted from a full queue; the worker saves them as failed audio.
+        self._vad_evicted: deque[bytes] = deque()
+        self._vad_chunk_ready = threading.Event()
+        self._vad_worker = None
+        self._vad_worker_lock = threading.Lock()
 
     # -- VAD Listening Mode --
 
@@ -51,45 +62,93 @@ class TranscriptionService:
 
     def start_listening(self):
         """Start continuous VAD listening."""
-        if self._vad:
-            return
-        from core.vad_listener import VADListener
-        try:
-            self._vad = VADListener(
-                on_speech_chunk=self._on_vad_chunk,
-                pause_threshold=self.config.vad_pause_threshold,
-                vad_aggressiveness=self.config.vad_aggressiveness,
-                min_speech_seconds=self.config.vad_min_speech_seconds,
-            )
-            self._vad.start()
-            logger.info("VAD listening started")
-        except Exception as e:
-            self._vad = None
-            logger.error("Failed to start VAD listening: %s", e)
-            if self._on_error:
-                self._on_error(f"Failed to start listening: {e}")
+        with self._vad_lock:
+            if self._vad:
+                return
+            from core.vad_listener import VADListener
+            try:
+                self._vad = VADListener(
+                    on_speech_chunk=self._on_vad_chunk,
+                    pause_threshold=self.config.vad_pause_threshold,
+                    vad_aggressiveness=self.config.vad_aggressiveness,
+                    min_speech_seconds=self.config.vad_min_speech_seconds,
+                )
+                self._vad.start()
+                logger.info("VAD listening started")
+            except Exception as e:
+                self._vad = None
+                logger.error("Failed to start VAD listening: %s", e)
+                if self._on_error:
+                    self._on_error(f"Failed to start listening: {e}")
 
     def stop_listening(self):
         """Stop VAD listening."""
-        if self._vad:
-            try:
-                self._vad.stop()
-            except Exception as e:
-                logger.error("Failed to stop VAD listening cleanly: %s", e)
-            self._vad = None
-            logger.info("VAD listening stopped")
+        with self._vad_lock:
+            if self._vad:
+                try:
+                    self._vad.stop()
+                except Exception as e:
+                    logger.error("Failed to stop VAD listening cleanly: %s", e)
+                self._vad = None
+                logger.info("VAD listening stopped")
 
     def is_listening(self) -> bool:
         return self._vad is not None
 
     def _on_vad_chunk(self, wav_bytes: bytes):
-        """VAD callback — transcribe chunk in a background thread."""
-        threading.Thread(
-            target=self._transcribe_bytes,
-            args=(wav_bytes, "vad_chunk"),
-            daemon=True,
-        ).start()
+        """VAD callback — queue chunk for the transcription worker."""
+        if len(self._vad_chunks) == self._vad_chunks.maxlen:
+            try:
+                self._vad_evicted.append(self._vad_chunks.popleft())
+            except IndexError:
+                pass
+        self._vad_chunks.append(wav_bytes)
+        self._vad_chunk_ready.set()
+        worker = self._vad_worker
+        if worker is None or not worker.is_alive():
+            self._ensure_vad_worker()
+
+    def _ensure_vad_worker(self):
+        with self._vad_worker_lock:
+            if self._vad_worker is not None and self._vad_worker.is_alive():
+                return
+            self._vad_worker = threading.Thread(target=self._vad_worker_loop, daemon=True)
+            self._vad_worker.start()
+
+    def _vad_worker_loop(self):
+        """Save evicted chunks, then transcribe queued ones in arrival order."""
+        while True:
+            self._vad_chunk_ready.wait()
+            self._vad_chunk_ready.clear()
+            while self._vad_evicted or self._vad_chunks:
+                evicted = bool(self._vad_evicted)
+                try:
+                    wav_bytes = (self._vad_evicted if evicted else self._vad_chunks).popleft()
+                except IndexError:
+                    break
+                try:
+                    if evicted:
+                        self._save_evicted_vad_chunk(wav_bytes)
+                    else:
+                        self._transcribe_bytes(wav_bytes, "vad_chunk")
+                except Exception:
+                    # Keep draining: later chunks must not stall behind one failure.
+                    logger.exception("VAD chunk %s failed", "save" if evicted else "transcription")
 
+    def _save_evicted_vad_chunk(self, wav_bytes: bytes):
+        """Save a chunk evicted from the full queue as failed audio rather than losing it."""
+        error = "Transcription queue is full"
+        logger.warning("%s; saving an untranscribed VAD chunk", error)
+        self._remember_failed_audio(wav_bytes=wav_bytes, source="vad_chunk")
+        backup = self._persist_failed_audio(wav_bytes, source="vad_chunk", error=error)
+        if self._on_error:
+            if backup:
+                self._on_error(
+                    f"{error}. Captured audio was saved to '{backup}'. You can retry when the server is back."
+                )
+            else:
+                self._on_error(f"{error}. The oldest captured speech was dropped.")
+
     # -- Manual Recording Mode --
 
     @property
@@ -227,6 +286,13 @@ class TranscriptionService:
                 restart_vad = True
 
         if restart_vad and self.is_listening():
+            # Stopping joins the mic thread, so keep it off the caller's (UI) thread.
+            threading.Thread(target=self._restart_vad, daemon=True).start()
+
+    def _restart_vad(self):
+        with self._vad_lock:
+            if not self.is_listening():
+                return
             try:
                 self.stop_listening()
                 self.start_listening()
@@ -56,7 +56,7 @@ class TTSService:
                 if use_optimization:
                     prepared_text = normalize_tts_text(raw_text)
                     chunks = split_tts_chunks(prepared_text, max_chars=self._chunk_target_chars)
-                    response_format = str(self.client.response_format or "").strip().lower()
+                    response_format = self.normalized_response_format
                     if len(chunks) > 1 and response_format == "wav":
                         logger.info("TTS input split into %d chunks for synthesis.", len(chunks))
                         chunk_audio = [self.client.synthesize(chunk) for chunk in chunks]
@@ -65,7 +65,7 @@ class TTSService:
                         if len(chunks) > 1:
                             logger.info(
                                 "TTS input exceeds chunk target but response_format=%s; using single request.",
-                                response_format or "unknown",
+                                response_format,
                             )
                         audio_bytes = self.client.synthesize(prepared_text)
                 else:
@@ -89,6 +89,11 @@ class TTSService:
             if key in kwargs and kwargs[key] is not None:
                 setattr(self.client, key, kwargs[key])
 
+    @property
+    def normalized_response_format(self) -> str:
+        """Lower-cased response format of the live client, or "unknown" when unset."""
+        return str(self.client.response_format or "").strip().lower() or "unknown"
+
     @staticmethod
     def _merge_wav_chunks(parts: list[bytes], silence_ms: int = 160) -> bytes:
         if not parts:
@@ -32,6 +32,28 @@ def _decode_pcm_to_float32(raw_frames: bytes, sample_width: int) -> np.ndarray:
     raise ValueError(f"Unsupported WAV sample width: {sample_width}")
 
 
+def decode_wav_bytes(audio_bytes: bytes) -> tuple[np.ndarray, int]:
+    """Decode WAV bytes to (frames, channels) float32 samples and the sample rate.
+
+    Touches no controller state, so it is safe to run on a worker thread.
+    """
+    if not audio_bytes:
+        raise ValueError("No audio bytes provided")
+    with io.BytesIO(audio_bytes) as buf:
+        with wave.open(buf, "rb") as wf:
+            channels = wf.getnchannels()
+            sample_rate = wf.getframerate()
+            sample_width = wf.getsampwidth()
+            raw_frames = wf.readframes(wf.getnframes())
+    if channels <= 0 or sample_rate <= 0:
+        raise ValueError("Invalid WAV format")
+
+    decoded = _decode_pcm_to_float32(raw_frames, sample_width)
+    if decoded.size == 0:
+        raise ValueError("WAV audio contains no frames")
+    return decoded.reshape(-1, channels).astype(np.float32, copy=False), int(sample_rate)
+
+
 class WavPlaybackController:
     """Audio transport with play/pause/stop/seek and runtime speed/pitch."""
 
@@ -46,22 +68,10 @@ class WavPlaybackController:
         self._pitch_semitones = 0.0
 
     def load_wav_bytes(self, audio_bytes: bytes):
-        if not audio_bytes:
-            raise ValueError("No audio bytes provided")
-        with io.BytesIO(audio_bytes) as buf:
-            with wave.open(buf, "rb") as wf:
-                channels = wf.getnchannels()
-                sample_rate = wf.getframerate()
-                sample_width = wf.getsampwidth()
-                raw_frames = wf.readframes(wf.getnframes())
-        if channels <= 0 or sample_rate <= 0:
-            raise ValueError("Invalid WAV format")
-
-        decoded = _decode_pcm_to_float32(raw_frames, sample_width)
-        if decoded.size == 0:
-            raise ValueError("WAV audio contains no frames")
-        audio = decoded.reshape(-1, channels).astype(np.float32, copy=False)
+        self.load_decoded(*decode_wav_bytes(audio_bytes))
 
+    def load_decoded(self, audio: np.ndarray, sample_rate: int):
+        """Swap in audio already produced by decode_wav_bytes."""
         with self._lock:
             self._close_stream_locked()
             self._audio = audio
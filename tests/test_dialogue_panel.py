@@ -0,0 +1,60 @@
+"""Regression tests for the dialogue transcript view."""
+
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtWidgets import QApplication
+except ModuleNotFoundError:  # pragma: no cover - optional GUI dependency
+    QApplication = None
+
+if QApplication is not None:
+    from ui.dialogue_panel import DialoguePanel
+else:  # pragma: no cover - optional GUI dependency
+    DialoguePanel = None
+
+
+class DialoguePanelTranscriptTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if QApplication is None:
+            raise unittest.SkipTest("PyQt6 not installed in this environment")
+        cls._app = QApplication.instance() or QApplication([])
+
+    def test_messages_append_as_separated_blocks(self):
+        panel = DialoguePanel()
+        panel.append_user("Hello")
+        panel.append_assistant("  Hi there  ")
+        panel.append_error("")
+
+        text = panel.text_dialogue.toPlainText()
+        blocks = text.split("\n\n")
+        self.assertEqual(len(blocks), 2)
+        self.assertTrue(blocks[0].endswith("You:\nHello"))
+        self.assertTrue(blocks[1].endswith("Assistant:\nHi there"))
+
+    def test_clear_dialogue_resets_separator(self):
+        panel = DialoguePanel()
+        panel.append_user("First")
+        panel.clear_dialogue()
+        panel.append_user("Second")
+
+        self.assertFalse(panel.text_dialogue.toPlainText().startswith("\n"))
+        self.assertTrue(panel.text_dialogue.toPlainText().endswith("You:\nSecond"))
+
+    def test_max_blocks_drops_oldest_lines(self):
+        panel = DialoguePanel()
+        panel.set_max_blocks(6)
+        for index in range(5):
+            panel.append_user(f"message {index}")
+
+        text = panel.text_dialogue.toPlainText()
+        self.assertLessEqual(panel.text_dialogue.document().blockCount(), 6)
+        self.assertNotIn("message 0", text)
+        self.assertTrue(text.endswith("You:\nmessage 4"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Regression tests for hotkey-to-Qt signal coalescing."""
+
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtWidgets import QApplication
+except ModuleNotFoundError:  # pragma: no cover - optional GUI dependency
+    QApplication = None
+
+if QApplication is not None:
+    from ui.hotkey_bridge import HotkeyBridge
+else:  # pragma: no cover - optional GUI dependency
+    HotkeyBridge = None
+
+
+class HotkeyBridgeTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if QApplication is None:
+            raise unittest.SkipTest("PyQt6 not installed in this environment")
+        cls._app = QApplication.instance() or QApplication([])
+
+    def test_burst_of_requests_emits_each_signal_once(self):
+        bridge = HotkeyBridge()
+        seen = []
+        bridge.listen_requested.connect(lambda: seen.append("listen"))
+        bridge.record_requested.connect(lambda: seen.append("record"))
+
+        for _ in range(3):
+            bridge.emit_listen_requested()
+        bridge.emit_record_requested()
+        self.assertEqual(seen, [])
+
+        self._app.processEvents()
+        self.assertEqual(seen, ["listen", "record"])
+
+        bridge.emit_listen_requested()
+        self._app.processEvents()
+        self.assertEqual(seen, ["listen", "record", "listen"])
+
+
+if __name__ == "__main__":
+    unittest.main()
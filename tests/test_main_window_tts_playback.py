@@ -0,0 +1,128 @@
+"""Regression tests for decoding TTS playback audio off the GUI thread."""
+
+import io
+import os
+import threading
+import time
+import unittest
+import wave
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtWidgets import QApplication
+except ModuleNotFoundError:  # pragma: no cover - optional GUI dependency
+    QApplication = None
+
+try:
+    import core.wav_playback as wav_playback
+    from core.app_config import AppConfig
+    from ui.main_window import MainWindow
+except (ImportError, OSError):  # pragma: no cover - needs PortAudio and pynput
+    MainWindow = None
+
+
+def _wav_bytes(frames: int) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(8000)
+        wf.writeframes(b"\x00\x00" * frames)
+    return buf.getvalue()
+
+
+class _FakePlayback:
+    def __init__(self):
+        self.loaded: list[tuple] = []
+        self.playing = False
+        self._duration = 0.0
+
+    def load_decoded(self, audio, sample_rate):
+        self.loaded.append((audio, sample_rate))
+        self._duration = audio.shape[0] / sample_rate
+
+    def get_duration_seconds(self):
+        return self._duration
+
+    def set_speed(self, speed):
+        pass
+
+    def set_pitch_semitones(self, semitones):
+        pass
+
+    def play(self):
+        self.playing = True
+
+    def stop(self):
+        self.playing = False
+
+    def close(self):
+        pass
+
+    def has_audio(self):
+        return bool(self.loaded)
+
+
+class MainWindowTtsPlaybackLoadTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if QApplication is None or MainWindow is None:
+            raise unittest.SkipTest("GUI or audio dependencies not installed in this environment")
+        cls._app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.window = MainWindow(AppConfig())
+        self.playback = _FakePlayback()
+        self.window.tts_playback = self.playback
+        self.decode_started = threading.Event()
+        self.release_decode = threading.Event()
+        self.decoded = threading.Event()
+        real_decode = wav_playback.decode_wav_bytes
+
+        def decode(audio_bytes):
+            self.decode_started.set()
+            self.release_decode.wait(2.0)
+            try:
+                return real_decode(audio_bytes)
+            finally:
+                self.decoded.set()
+
+        patcher = mock.patch.object(wav_playback, "decode_wav_bytes", side_effect=decode)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.window.deleteLater)
+
+    def _drain_events(self):
+        self.assertTrue(self.decoded.wait(2.0), "Timed out waiting for the decode worker.")
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            self._app.processEvents()
+
+    def test_decoded_audio_is_installed_on_the_gui_thread(self):
+        self.window._start_tts_playback_load(_wav_bytes(8000), "Playing", "Playback failed")
+        self.assertTrue(self.decode_started.wait(2.0))
+        self.assertEqual(self.playback.loaded, [])
+
+        self.release_decode.set()
+        self._drain_events()
+
+        self.assertEqual(len(self.playback.loaded), 1)
+        self.assertEqual(self.playback.loaded[0][1], 8000)
+        self.assertTrue(self.playback.playing)
+
+    def test_stop_during_decode_keeps_new_audio_out_of_the_controller(self):
+        self.window._start_tts_playback_load(_wav_bytes(8000), "Playing", "Playback failed")
+        self.assertTrue(self.decode_started.wait(2.0))
+        self.window._stop_tts_playback()
+
+        self.release_decode.set()
+        self._drain_events()
+
+        self.assertEqual(self.playback.loaded, [])
+        self.assertFalse(self.playback.playing)
+
+
+if __name__ == "__main__":
+    unittest.main()
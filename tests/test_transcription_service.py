@@ -0,0 +1,145 @@
+"""Unit tests for TranscriptionService VAD chunk hand-off."""
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from core.app_config import AppConfig
+from core.transcription_service import VAD_CHUNK_QUEUE_LIMIT, TranscriptionService
+
+
+class _FakeSTTClient:
+    def __init__(self):
+        self.calls: list[bytes] = []
+        self.language = "english"
+        self.response_format = "json"
+
+    def transcribe_bytes(self, wav_bytes: bytes) -> str:
+        self.calls.append(wav_bytes)
+        return wav_bytes.decode("ascii")
+
+
+class _FailingOnceSTTClient(_FakeSTTClient):
+    def transcribe_bytes(self, wav_bytes: bytes) -> str:
+        if wav_bytes == b"bad":
+            raise RuntimeError("server unavailable")
+        return super().transcribe_bytes(wav_bytes)
+
+
+class TranscriptionServiceVadQueueTests(unittest.TestCase):
+    def test_vad_chunks_are_transcribed_in_arrival_order(self):
+        done = threading.Event()
+        results: list[str] = []
+
+        def on_transcription(text: str):
+            results.append(text)
+            if len(results) == 3:
+                done.set()
+
+        service = TranscriptionService(AppConfig(), on_transcription=on_transcription)
+        service.client = _FakeSTTClient()
+
+        for chunk in (b"one", b"two", b"three"):
+            service._on_vad_chunk(chunk)
+
+        self.assertTrue(done.wait(2.0), "Timed out waiting for VAD transcription worker.")
+        self.assertEqual(results, ["one", "two", "three"])
+        self.assertEqual(len(service._vad_chunks), 0)
+
+    def test_worker_survives_a_failing_error_callback(self):
+        done = threading.Event()
+        results: list[str] = []
+
+        def on_transcription(text: str):
+            results.append(text)
+            done.set()
+
+        def on_error(message: str):
+            raise RuntimeError("error handler failed")
+
+        service = TranscriptionService(AppConfig(), on_transcription=on_transcription, on_error=on_error)
+        service.client = _FailingOnceSTTClient()
+        service._persist_failed_audio = lambda *args, **kwargs: None
+
+        with self.assertLogs("core.transcription_service", level="ERROR") as logs:
+            service._on_vad_chunk(b"bad")
+            service._on_vad_chunk(b"good")
+            self.assertTrue(done.wait(2.0), "Worker stopped after a failing error callback.")
+        self.assertEqual(results, ["good"])
+        self.assertTrue(any("VAD chunk transcription failed" in line for line in logs.output))
+
+    def test_full_queue_hands_the_evicted_chunk_to_the_worker(self):
+        errors: list[str] = []
+        done = threading.Event()
+        results: list[str] = []
+
+        def on_transcription(text: str):
+            results.append(text)
+            if len(results) == VAD_CHUNK_QUEUE_LIMIT:
+                done.set()
+
+        service = TranscriptionService(AppConfig(), on_transcription=on_transcription, on_error=errors.append)
+        service.client = _FakeSTTClient()
+        service._vad_worker = _BusyWorker()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            service._recovery_root = Path(tmp)
+            for index in range(VAD_CHUNK_QUEUE_LIMIT + 1):
+                service._on_vad_chunk(f"chunk{index}".encode("ascii"))
+
+            # The VAD thread only queues; saving waits for the worker.
+            self.assertEqual(list(service._vad_evicted), [b"chunk0"])
+            self.assertEqual(service._vad_chunks[0], b"chunk1")
+            self.assertEqual(list(Path(tmp).iterdir()), [])
+            self.assertEqual(errors, [])
+
+            service._vad_worker = None
+            with self.assertLogs("core.transcription_service", level="WARNING"):
+                service._ensure_vad_worker()
+                self.assertTrue(done.wait(2.0), "Timed out waiting for VAD transcription worker.")
+
+            saved = list(Path(tmp).glob("*.wav"))
+            self.assertEqual(len(saved), 1)
+            self.assertEqual(saved[0].read_bytes(), b"chunk0")
+
+        self.assertEqual(results[0], "chunk1")
+        self.assertEqual(len(errors), 1)
+        self.assertIn("queue is full", errors[0])
+
+
+class _BusyWorker:
+    """Stands in for a worker stuck on a slow request, so nothing drains."""
+
+    def is_alive(self) -> bool:
+        return True
+
+
+class _BlockingVad:
+    def __init__(self):
+        self.release = threading.Event()
+        self.stopped = threading.Event()
+
+    def stop(self):
+        self.release.wait(2.0)
+        self.stopped.set()
+
+
+class TranscriptionServiceVadRestartTests(unittest.TestCase):
+    def test_vad_restart_does_not_block_update_settings(self):
+        service = TranscriptionService(AppConfig())
+        vad = _BlockingVad()
+        service._vad = vad
+        restarted = threading.Event()
+        service.start_listening = restarted.set
+
+        service.update_settings(vad_aggressiveness=(service.config.vad_aggressiveness + 1) % 4)
+
+        self.assertFalse(vad.stopped.is_set())
+        vad.release.set()
+        self.assertTrue(restarted.wait(2.0), "Timed out waiting for VAD restart.")
+        self.assertTrue(vad.stopped.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
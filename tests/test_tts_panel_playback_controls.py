@@ -23,25 +23,23 @@ class TTSPanelPlaybackControlsTests(unittest.TestCase):
             raise unittest.SkipTest("PyQt6 not installed in this environment")
         cls._app = QApplication.instance() or QApplication([])
 
-    def test_speed_step_controls_adjust_both_directions(self):
-        panel = TTSPanel()
-        panel.set_playback_available(True)
-
-        initial = panel.get_playback_speed()
-        panel._step_speed(1)
-        self.assertGreater(panel.get_playback_speed(), initial)
-        panel._step_speed(-1)
-        self.assertAlmostEqual(panel.get_playback_speed(), initial, places=6)
-
-    def test_pitch_step_controls_adjust_both_directions(self):
-        panel = TTSPanel()
-        panel.set_playback_available(True)
+    def test_step_controls_adjust_both_directions(self):
+        cases = (
+            ("speed", "_step_speed", "get_playback_speed"),
+            ("pitch", "_step_pitch", "get_playback_pitch"),
+        )
+        for label, step_name, getter_name in cases:
+            with self.subTest(control=label):
+                panel = TTSPanel()
+                panel.set_playback_available(True)
+                step = getattr(panel, step_name)
+                getter = getattr(panel, getter_name)
 
-        initial = panel.get_playback_pitch()
-        panel._step_pitch(1)
-        self.assertGreater(panel.get_playback_pitch(), initial)
-        panel._step_pitch(-1)
-        self.assertAlmostEqual(panel.get_playback_pitch(), initial, places=6)
+                initial = getter()
+                step(1)
+                self.assertGreater(getter(), initial)
+                step(-1)
+                self.assertAlmostEqual(getter(), initial, places=6)
 
     def test_api_speed_control_set_and_clamp(self):
         panel = TTSPanel()
@@ -58,6 +56,22 @@ class TTSPanelPlaybackControlsTests(unittest.TestCase):
         panel.btn_open_saved_audio.click()
         self.assertEqual(len(seen), 1)
 
+    def test_transport_setters_track_state_changes(self):
+        panel = TTSPanel()
+        panel.set_duration(65.0)
+        panel.set_position(61.4)
+        panel.set_playing(True)
+
+        self.assertEqual(panel.lbl_duration.text(), "01:05")
+        self.assertEqual(panel.lbl_position.text(), "01:01")
+        self.assertEqual(panel.slider_position.value(), 61400)
+        self.assertEqual(panel.btn_play_pause.text(), "Pause")
+
+        panel.set_playback_available(False)
+        self.assertEqual(panel.slider_position.maximum(), 0)
+        self.assertEqual(panel.lbl_position.text(), "00:00")
+        self.assertEqual(panel.btn_play_pause.text(), "Play")
+
 
 if __name__ == "__main__":
     unittest.main()
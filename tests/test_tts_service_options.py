@@ -32,6 +32,13 @@ class _FakeTTSClient:
 
 
 class TTSServiceOptionsTests(unittest.TestCase):
+    @staticmethod
+    def _make_service() -> tuple[TTSService, _FakeTTSClient]:
+        service = TTSService(AppConfig())
+        fake_client = _FakeTTSClient()
+        service.client = fake_client
+        return service, fake_client
+
     def _run_service(self, service: TTSService, text: str, **kwargs) -> dict:
         done = threading.Event()
         result: dict = {}
@@ -51,10 +58,7 @@ class TTSServiceOptionsTests(unittest.TestCase):
         return result
 
     def test_optimize_disabled_keeps_raw_text(self):
-        config = AppConfig()
-        service = TTSService(config)
-        fake_client = _FakeTTSClient()
-        service.client = fake_client
+        service, fake_client = self._make_service()
 
         raw_text = "this long text has no punctuation and should be sent exactly as entered by the user"
         result = self._run_service(
@@ -68,10 +72,7 @@ class TTSServiceOptionsTests(unittest.TestCase):
         self.assertEqual(fake_client.calls, [raw_text])
 
     def test_optimize_enabled_rewrites_long_text(self):
-        config = AppConfig()
-        service = TTSService(config)
-        fake_client = _FakeTTSClient()
-        service.client = fake_client
+        service, fake_client = self._make_service()
 
         raw_text = (
             "this is a long paragraph without punctuation and it keeps going "
@@ -91,10 +92,7 @@ class TTSServiceOptionsTests(unittest.TestCase):
         self.assertIn(".", fake_client.calls[0])
 
     def test_optimize_enabled_but_below_threshold_keeps_raw_text(self):
-        config = AppConfig()
-        service = TTSService(config)
-        fake_client = _FakeTTSClient()
-        service.client = fake_client
+        service, fake_client = self._make_service()
 
         raw_text = "short text without punctuation"
         result = self._run_service(
@@ -107,6 +105,21 @@ class TTSServiceOptionsTests(unittest.TestCase):
         self.assertNotIn("error", result)
         self.assertEqual(fake_client.calls, [raw_text])
 
+    def test_normalized_response_format_follows_the_client(self):
+        service = TTSService(AppConfig())
+
+        service.update_settings(response_format="  MP3 ")
+        self.assertEqual(service.normalized_response_format, "mp3")
+
+        service.update_settings(voice="sarah")
+        self.assertEqual(service.normalized_response_format, "mp3")
+
+        service.client = _FakeTTSClient()
+        self.assertEqual(service.normalized_response_format, "wav")
+
+        service.client.response_format = ""
+        self.assertEqual(service.normalized_response_format, "unknown")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -24,7 +24,7 @@ def _configure_logging():
     level = getattr(logging, LOG_LEVEL, logging.INFO)
     handlers = [logging.StreamHandler()]
     if LOG_FILE:
-        handlers.append(logging.FileHandler(LOG_FILE, encoding="utf-8"))
+        handlers.append(logging.FileHandler(LOG_FILE, encoding="utf-8", delay=True))
     logging.basicConfig(
         level=level,
         format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import time
 
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import (
@@ -11,6 +11,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QPlainTextEdit,
     QPushButton,
     QTextEdit,
     QVBoxLayout,
@@ -19,6 +20,12 @@ from PyQt6.QtWidgets import (
 
 from ui.icon_library import ui_icon
 
+DIALOGUE_MAX_BLOCKS = 2000
+
+
+def _clean(value: str | None) -> str:
+    return value.strip() if value else ""
+
 
 class DialoguePanel(QWidget):
     """Chat UI controls + conversation transcript view."""
@@ -61,9 +68,10 @@ class DialoguePanel(QWidget):
         layout.addLayout(options_row)
 
         layout.addWidget(QLabel("Dialogue"))
-        self.text_dialogue = QTextEdit()
+        self.text_dialogue = QPlainTextEdit()
         self.text_dialogue.setReadOnly(True)
         self.text_dialogue.setPlaceholderText("Conversation will appear here.")
+        self.text_dialogue.setMaximumBlockCount(DIALOGUE_MAX_BLOCKS)
         layout.addWidget(self.text_dialogue)
 
         layout.addWidget(QLabel("Your Message"))
@@ -95,7 +103,7 @@ class DialoguePanel(QWidget):
             self.input_message.clear()
 
     def _on_model_changed(self, text: str):
-        candidate = (text or "").strip()
+        candidate = _clean(text)
         if candidate:
             self.model_changed.emit(candidate)
 
@@ -123,7 +131,7 @@ class DialoguePanel(QWidget):
         self.chk_include_history.setEnabled(ready)
 
     def set_model(self, model: str, emit: bool = False):
-        value = (model or "").strip()
+        value = _clean(model)
         if not value:
             return
         self.combo_model.blockSignals(True)
@@ -138,7 +146,7 @@ class DialoguePanel(QWidget):
 
     def set_system_prompt(self, prompt: str, emit: bool = False):
         self.input_system_prompt.blockSignals(True)
-        self.input_system_prompt.setText((prompt or "").strip())
+        self.input_system_prompt.setText(_clean(prompt))
         self.input_system_prompt.blockSignals(False)
         if emit:
             self.system_prompt_changed.emit(self.get_system_prompt())
@@ -151,9 +159,13 @@ class DialoguePanel(QWidget):
             self.history_mode_changed.emit(bool(enabled))
 
     def set_input_text(self, text: str):
-        self.input_message.setPlainText((text or "").strip())
+        self.input_message.setPlainText(_clean(text))
         self.input_message.setFocus()
 
+    def set_max_blocks(self, max_blocks: int):
+        """Cap transcript lines; oldest lines are dropped first (0 = unlimited)."""
+        self.text_dialogue.setMaximumBlockCount(max(0, int(max_blocks)))
+
     def clear_dialogue(self):
         self.text_dialogue.clear()
 
@@ -167,14 +179,9 @@ class DialoguePanel(QWidget):
         self._append_message("Error", text)
 
     def _append_message(self, role: str, text: str):
-        body = (text or "").strip()
+        body = _clean(text)
         if not body:
             return
-        stamp = datetime.now().strftime("%H:%M:%S")
-        prefix = f"[{stamp}] {role}:"
-        current = self.text_dialogue.toPlainText().rstrip()
-        block = f"{prefix}\n{body}"
-        self.text_dialogue.setPlainText(f"{current}\n\n{block}" if current else block)
-        cursor = self.text_dialogue.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        self.text_dialogue.setTextCursor(cursor)
+        stamp = time.strftime("%H:%M:%S")
+        separator = "" if self.text_dialogue.document().isEmpty() else "\n"
+        self.text_dialogue.appendPlainText(f"{separator}[{stamp}] {role}:\n{body}")
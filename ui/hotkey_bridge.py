@@ -1,17 +1,45 @@
 """Thread-safe bridge from background hotkey callbacks into Qt signals."""
 
-from PyQt6.QtCore import QObject, pyqtSignal
+import threading
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
 
 
 class HotkeyBridge(QObject):
-    """Emit Qt signals so UI actions run on the main Qt thread."""
+    """Emit Qt signals so UI actions run on the main Qt thread.
+
+    Requests arriving in a burst (e.g. key repeat) are coalesced so each
+    signal fires at most once per event-loop pass.
+    """
 
     listen_requested = pyqtSignal()
     record_requested = pyqtSignal()
+    _flush_requested = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending: set[str] = set()
+        self._pending_lock = threading.Lock()
+        self._flush_requested.connect(self._flush_pending, Qt.ConnectionType.QueuedConnection)
 
     def emit_listen_requested(self):
-        self.listen_requested.emit()
+        self._request("listen")
 
     def emit_record_requested(self):
-        self.record_requested.emit()
+        self._request("record")
+
+    def _request(self, kind: str):
+        with self._pending_lock:
+            schedule = not self._pending
+            self._pending.add(kind)
+        if schedule:
+            self._flush_requested.emit()
 
+    def _flush_pending(self):
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = set()
+        if "listen" in pending:
+            self.listen_requested.emit()
+        if "record" in pending:
+            self.record_requested.emit()
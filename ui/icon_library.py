@@ -1,9 +1,10 @@
 """Centralized UI icon lookup with asset-first fallback behavior."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QWidget, QStyle
+from PyQt6.QtWidgets import QApplication, QWidget, QStyle
 
 from core.assets import asset_path
 
@@ -72,28 +73,33 @@ UI_ICON_FALLBACKS: dict[str, QStyle.StandardPixmap] = {
     "listening_retry_last": QStyle.StandardPixmap.SP_BrowserReload,
 }
 
-_CACHE: dict[str, QIcon] = {}
-
-
-def _icon_asset_path(icon_key: str) -> Path | None:
-    name = UI_ICON_FILES.get(icon_key, "")
-    return asset_path("icons", "ui", name) if name else None
+# Per-key (asset path, native fallback) pair so lookups need a single probe.
+_ICON_RECORDS: dict[str, tuple[Path | None, QStyle.StandardPixmap | None]] = {
+    key: (
+        asset_path("icons", "ui", UI_ICON_FILES[key]) if UI_ICON_FILES.get(key) else None,
+        UI_ICON_FALLBACKS.get(key),
+    )
+    for key in UI_ICON_FILES.keys() | UI_ICON_FALLBACKS.keys()
+}
 
 
 def ui_icon(widget: QWidget, icon_key: str) -> QIcon:
     """Load branded icon from assets, or fall back to a native Qt icon."""
-    cached = _CACHE.get(icon_key)
-    if cached is not None:
-        return cached
+    return _resolve_icon(icon_key)
+
+
+@lru_cache(maxsize=None)
+def _resolve_icon(icon_key: str) -> QIcon:
+    """Resolve an icon once per key, caching fallbacks and empty icons too.
 
-    path = _icon_asset_path(icon_key)
+    Native fallbacks come from the application style; the app's stylesheets
+    do not override standard icons, so every widget would resolve the same.
+    """
+    path, fallback = _ICON_RECORDS.get(icon_key, (None, None))
+    icon = QIcon()
     if path is not None and path.exists():
         icon = QIcon(str(path))
-        if not icon.isNull():
-            _CACHE[icon_key] = icon
-            return icon
 
-    fallback = UI_ICON_FALLBACKS.get(icon_key)
-    if fallback is not None:
-        return widget.style().standardIcon(fallback)
-    return QIcon()
+    if icon.isNull() and fallback is not None:
+        icon = QApplication.style().standardIcon(fallback)
+    return icon
@@ -1,16 +1,20 @@
 """Main application window — coordinates services and UI panels."""
 
 import logging
+import re
+import threading
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QTextEdit, QLabel, QComboBox, QToolButton, QFileDialog, QApplication,
+    QPushButton, QPlainTextEdit, QLabel, QComboBox, QToolButton, QFileDialog, QApplication,
     QSystemTrayIcon, QSplitter, QSizePolicy, QGroupBox,
 )
-from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QSize, QSignalBlocker, pyqtSignal, pyqtSlot
 
 from core.app_config import AppConfig
 from core.audio_format import detect_audio_format
@@ -18,7 +22,6 @@ from core.dialogue_service import DialogueService
 from core.transcription_service import TranscriptionService
 from core.tts_service import TTSService
 from core.text_output import copy_to_clipboard
-from core.wav_playback import WavPlaybackController
 from ui.dialogue_panel import DialoguePanel
 from ui.icon_library import ui_icon
 from ui.tts_panel import TTSPanel
@@ -27,16 +30,265 @@ from ui.settings_panel import SettingsPanel
 logger = logging.getLogger(__name__)
 OUTPUT_HISTORY_LIMIT = 3
 OUTPUT_HISTORY_PREVIEW_CHARS = 40
+_WORD_RE = re.compile(r"\S+")
+# Error text that points at the API server or network rather than local input.
+_SERVER_FAILURE_RE = re.compile(
+    r"http|timeout|timed out|connection|request failed|status code|server"
+    r"|(?:captured|source) audio was saved",
+    re.IGNORECASE,
+)
+SPLITTER_SAVE_DEBOUNCE_MS = 150
+OUTPUT_HISTORY_SAVE_DEBOUNCE_MS = 250
+STT_FILE_FILTER = "Audio Files (*.mp3 *.wav *.flac *.m4a *.ogg);;All Files (*)"
+TTS_OPEN_FILTER = "Audio Files (*.wav *.flac *.mp3 *.ogg);;WAV Audio (*.wav);;All Files (*)"
+TTS_SAVE_FILTERS = {
+    "wav": "WAV Audio (*.wav);;All Files (*)",
+    "flac": "FLAC Audio (*.flac);;All Files (*)",
+    "mp3": "MP3 Audio (*.mp3);;All Files (*)",
+    "ogg": "OGG Audio (*.ogg);;All Files (*)",
+}
+
+# Panel signal -> MainWindow slot wiring, applied when each panel is built.
+_PANEL_CONNECTIONS: dict[str, tuple[tuple[str, str], ...]] = {
+    "tts_panel": (
+        ("generate_requested", "_on_tts_generate"),
+        ("optimization_settings_changed", "_on_tts_optimization_settings_changed"),
+        ("use_output_requested", "_load_tts_from_output"),
+        ("save_audio_requested", "_save_last_tts_audio"),
+        ("open_saved_audio_requested", "_open_saved_tts_audio"),
+        ("tts_profile_selected", "_on_tts_profile_selected"),
+        ("play_pause_requested", "_toggle_tts_playback"),
+        ("stop_requested", "_stop_tts_playback"),
+        ("seek_requested", "_seek_tts_playback"),
+        ("speed_changed", "_set_tts_playback_speed"),
+        ("pitch_changed", "_set_tts_playback_pitch"),
+        ("api_speed_changed", "_on_tts_api_speed_changed"),
+    ),
+    "dialogue_panel": (
+        ("send_requested", "_on_dialogue_send"),
+        ("reset_requested", "_on_dialogue_reset"),
+        ("use_output_requested", "_load_dialogue_from_output"),
+        ("model_changed", "_on_dialogue_model_changed"),
+        ("system_prompt_changed", "_on_dialogue_system_prompt_changed"),
+        ("history_mode_changed", "_on_dialogue_history_mode_changed"),
+    ),
+    "settings_panel": (
+        ("hotkeys_save_requested", "_on_hotkeys_saved"),
+        ("stt_settings_changed", "_on_stt_settings_from_panel"),
+        ("tts_settings_changed", "_on_tts_settings_from_panel"),
+        ("profiles_changed", "_on_profiles_from_panel"),
+        ("tts_profiles_changed", "_on_tts_profiles_from_panel"),
+        ("ui_settings_changed", "_on_ui_settings_from_panel"),
+    ),
+}
+
+# Single-character wrappers stripped from transcriptions, keyed opener -> closer.
+_QUOTE_CLOSERS = {'"': '"', "'": "'", "`": "`", "“": "”", "‘": "’"}
+_PAREN_CLOSERS = {"(": ")", "（": "）"}
+_WRAPPER_CLOSERS = {**_QUOTE_CLOSERS, **_PAREN_CLOSERS}
+
+# Window-level theme stylesheets; capture-button rules are appended by _theme_qss().
+_DARK_STYLESHEET = """
+QMainWindow { background: #12161c; }
+QTabWidget::pane { border: 1px solid #303b49; background: #1a1f27; border-radius: 8px; }
+QTabBar::tab {
+    background: #222a34;
+    color: #cfd7e4;
+    border: 1px solid #303b49;
+    padding: 6px 12px;
+    margin-right: 4px;
+    border-top-left-radius: 6px;
+    border-top-right-radius: 6px;
+}
+QTabBar::tab:selected { background: #2b3442; border-bottom-color: #2b3442; color: #eef3f8; }
+QScrollArea#settingsScrollArea { background: #1a1f27; border: none; }
+QScrollArea#settingsScrollArea > QWidget#qt_scrollarea_viewport { background: #1a1f27; }
+QWidget#settingsScrollContent { background: #1a1f27; }
+QTextEdit, QPlainTextEdit, QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {
+    border: 1px solid #3a4554;
+    border-radius: 6px;
+    padding: 4px;
+    background: #131922;
+    color: #dce5f2;
+}
+QPushButton { background: #5a6d84; color: #f2f6fb; border: none; border-radius: 6px; padding: 6px 10px; }
+QPushButton:hover { background: #667a92; }
+QPushButton:pressed { background: #4d6076; }
+QToolButton[role="tts-adjust"] {
+    background: #3a4656;
+    color: #9fb0c3;
+    border: 1px solid #4a5a6d;
+    border-radius: 6px;
+    padding: 4px 8px;
+    min-width: 22px;
+}
+QToolButton[role="tts-adjust"]:enabled {
+    background: #9a7a53;
+    color: #f6efe6;
+    border: 1px solid #ad8b64;
+}
+QToolButton[role="tts-adjust"]:enabled:hover { background: #a88964; }
+QToolButton[role="tts-adjust"]:enabled:pressed { background: #856947; }
+QLabel { color: #cfd7e4; }
+QCheckBox { color: #cfd7e4; }
+QStatusBar { background: #1a1f27; color: #cfd7e4; border-top: 1px solid #303b49; }
+"""
+
+_LIGHT_STYLESHEET = """
+QMainWindow { background: #f3f7fb; }
+QTabWidget::pane { border: 1px solid #c8d6e5; background: #ffffff; border-radius: 8px; }
+QTabBar::tab { background: #dfeaf4; border: 1px solid #b8cadb; padding: 6px 12px; margin-right: 4px; border-top-left-radius: 6px; border-top-right-radius: 6px; }
+QTabBar::tab:selected { background: #ffffff; border-bottom-color: #ffffff; }
+QScrollArea#settingsScrollArea { background: #ffffff; border: none; }
+QScrollArea#settingsScrollArea > QWidget#qt_scrollarea_viewport { background: #ffffff; }
+QWidget#settingsScrollContent { background: #ffffff; }
+QTextEdit, QPlainTextEdit, QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {
+    border: 1px solid #b8cadb;
+    border-radius: 6px;
+    padding: 4px;
+    background: #fbfdff;
+}
+QPushButton { background: #2f6d9a; color: #ffffff; border: none; border-radius: 6px; padding: 6px 10px; }
+QPushButton:hover { background: #3c7cab; }
+QPushButton:pressed { background: #285f86; }
+QToolButton[role="tts-adjust"] {
+    background: #e7eef6;
+    color: #1f3b53;
+    border: 1px solid #b8cadb;
+    border-radius: 6px;
+    padding: 4px 8px;
+    min-width: 22px;
+}
+QToolButton[role="tts-adjust"]:enabled:hover { background: #d7e5f3; }
+QToolButton[role="tts-adjust"]:enabled:pressed { background: #c7daec; }
+QLabel { color: #1f3b53; }
+QCheckBox { color: #1f3b53; }
+"""
+
+
+@dataclass(frozen=True)
+class _ThemePalette:
+    """Styling for one theme, resolved at import so a theme switch swaps one object."""
+
+    window_qss: str
+    server_online_qss: str
+    server_offline_qss: str
+    retry_enabled_qss: str
+    retry_disabled_qss: str
+
+
+def _button_palette_qss(
+    selector: str,
+    base: str,
+    hover: str,
+    pressed: str,
+    disabled_bg: Optional[str] = None,
+    disabled_text: str = "#ffffff",
+    text: str = "#ffffff",
+) -> str:
+    """Build the window-stylesheet rules for one capture-button role selector."""
+    button = f"QPushButton{selector}"
+    return (
+        f"{button} {{ background: {base}; color: {text}; border: none; border-radius: 6px; padding: 6px 10px; }}\n"
+        f"{button}:hover {{ background: {hover}; }}\n"
+        f"{button}:pressed {{ background: {pressed}; }}\n"
+        f"{button}:disabled {{ background: {disabled_bg or base}; color: {disabled_text}; }}\n"
+    )
+
+
+def _server_status_qss(background: str, border: str) -> str:
+    return f"""
+        QToolButton {{
+            background: {background};
+            border: 1px solid {border};
+            border-radius: 6px;
+            padding: 4px;
+        }}
+        """
+
+
+def _retry_button_qss(background: str, hover: str, border: str) -> str:
+    return f"""
+        QToolButton {{
+            background: {background};
+            border: 1px solid {border};
+            border-radius: 6px;
+            padding: 4px;
+        }}
+        QToolButton:hover {{
+            background: {hover};
+        }}
+        """
+
+
+# Capture buttons are styled through role/state dynamic properties, so state
+# changes only repolish one button and theme switches need no per-button sheets.
+# Values: (base, hover, pressed[, disabled background, disabled text]).
+_LISTEN_IDLE = '[role="capture-listen"][state="idle"]'
+_LISTEN_ACTIVE = '[role="capture-listen"][state="active"]'
+_LIGHT_CAPTURE_BUTTONS = {
+    _LISTEN_IDLE: ("#a97845", "#b78451", "#93673b"),
+    _LISTEN_ACTIVE: ("#8f3b3b", "#a14848", "#7a3030"),
+    '[role="rec-start"]': ("#5f8873", "#6e9782", "#527762", "#cfd8e2", "#6b7786"),
+    '[role="rec-pause"]': ("#557b69", "#638975", "#4a6c5c", "#cfd8e2", "#6b7786"),
+    '[role="rec-stop"]': ("#b06a6a", "#bf7878", "#9a5d5d", "#cfd8e2", "#6b7786"),
+    '[role="file-select"]': ("#718a58", "#7f9965", "#60764a"),
+    '[role="file-transcribe"]': ("#5f8872", "#6f9781", "#517764", "#cfd8e2", "#6b7786"),
+}
+_DARK_CAPTURE_BUTTONS = {
+    _LISTEN_IDLE: ("#986e43", "#a77c4f", "#845f39"),
+    _LISTEN_ACTIVE: ("#7a3030", "#8b3737", "#682626"),
+    '[role="rec-start"]': ("#5a7f70", "#6a8f7f", "#4e6f63", "#445160", "#bcc8d8"),
+    '[role="rec-pause"]': ("#4f7264", "#5d8474", "#456558", "#445160", "#bcc8d8"),
+    '[role="rec-stop"]': ("#a26666", "#b27575", "#8d5858", "#445160", "#bcc8d8"),
+    '[role="file-select"]': ("#6f7f57", "#7d8e64", "#5f6d4a"),
+    '[role="file-transcribe"]': ("#5e7d67", "#6d8c76", "#506b59", "#445160", "#bcc8d8"),
+}
+
+
+def _theme_qss(base_qss: str, capture_buttons: dict[str, tuple[str, ...]]) -> str:
+    return base_qss + "".join(
+        _button_palette_qss(selector, *colors) for selector, colors in capture_buttons.items()
+    )
+
+
+_LIGHT_THEME = _ThemePalette(
+    window_qss=_theme_qss(_LIGHT_STYLESHEET, _LIGHT_CAPTURE_BUTTONS),
+    server_online_qss=_server_status_qss("#6a9a81", "#58826d"),
+    server_offline_qss=_server_status_qss("#b87474", "#9f6464"),
+    retry_enabled_qss=_retry_button_qss("#6a86a3", "#7893af", "#5c7893"),
+    retry_disabled_qss=_retry_button_qss("#b0bfcd", "#b0bfcd", "#9fb0c0"),
+)
+_DARK_THEME = _ThemePalette(
+    window_qss=_theme_qss(_DARK_STYLESHEET, _DARK_CAPTURE_BUTTONS),
+    server_online_qss=_server_status_qss("#4f7a68", "#456a5a"),
+    server_offline_qss=_server_status_qss("#9a6262", "#865656"),
+    retry_enabled_qss=_retry_button_qss("#5e738b", "#6b8199", "#51657c"),
+    retry_disabled_qss=_retry_button_qss("#4a5868", "#4a5868", "#425060"),
+)
+
+
+@lru_cache(maxsize=256)
+def _format_iso_stamp(raw: str) -> str:
+    """Format a stored ISO timestamp; saved history repeats the same stamps."""
+    try:
+        return datetime.fromisoformat(raw).strftime("%Y-%m-%d %H:%M")
+    except ValueError:
+        normalized = raw.replace("T", " ")
+        return normalized[:16] if len(normalized) >= 16 else normalized
 
 
 class MainWindow(QMainWindow):
     """Main application window with Capture / TTS / Dialogue / Settings tabs."""
 
     # Signals for thread-safe service callbacks
-    _transcription_ready = pyqtSignal(str)
-    _transcription_error = pyqtSignal(str)
-    _tts_audio_ready = pyqtSignal(bytes)
+    # object, not str: long transcripts reach the slot without a QString round-trip
+    _transcription_ready = pyqtSignal(object)
+    _transcription_error = pyqtSignal(object)
+    _tts_audio_ready = pyqtSignal(object)  # bytes passed by reference, no QByteArray copy
     _tts_error = pyqtSignal(str)
+    _tts_playback_loaded = pyqtSignal(int, object, str)
+    _tts_playback_load_failed = pyqtSignal(int, str)
     _dialogue_reply = pyqtSignal(str)
     _dialogue_error = pyqtSignal(str)
 
@@ -45,6 +297,8 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("LemonFox Transcriber")
         self.setMinimumHeight(480)
         self.resize(980, 680)
+        # Build the whole widget tree before the first layout/paint pass.
+        self.setUpdatesEnabled(False)
 
         self._config = config or AppConfig.from_env()
 
@@ -64,20 +318,39 @@ class MainWindow(QMainWindow):
             on_reply=self._dialogue_reply.emit,
             on_error=self._dialogue_error.emit,
         )
-        self.tts_playback = WavPlaybackController()
+        self.tts_playback = None  # Lazy-loaded (needs PortAudio)
+        # Bumped per load and on stop so late decodes never start stale audio.
+        self._tts_load_token = 0
         self._tts_ui_timer = QTimer(self)
         self._tts_ui_timer.setInterval(120)
         self._tts_ui_timer.timeout.connect(self._refresh_tts_playback_ui)
+        self._splitter_save_timer = QTimer(self)
+        self._splitter_save_timer.setSingleShot(True)
+        self._splitter_save_timer.setInterval(SPLITTER_SAVE_DEBOUNCE_MS)
+        self._splitter_save_timer.timeout.connect(self._flush_splitter_sizes)
+        self._output_history_save_timer = QTimer(self)
+        self._output_history_save_timer.setSingleShot(True)
+        self._output_history_save_timer.setInterval(OUTPUT_HISTORY_SAVE_DEBOUNCE_MS)
+        self._output_history_save_timer.timeout.connect(self._flush_output_history)
+        app = QApplication.instance()
+        if app is not None:
+            # Tray "Quit" calls app.quit() directly, so a hidden window never sees closeEvent.
+            app.aboutToQuit.connect(self._flush_pending_saves)
 
         # Connect signals to UI handlers (runs on main thread)
         self._transcription_ready.connect(self._on_transcription_done)
         self._transcription_error.connect(self._on_transcription_error)
         self._tts_audio_ready.connect(self._on_tts_done_play)
         self._tts_error.connect(self._on_tts_error)
+        self._tts_playback_loaded.connect(self._on_tts_playback_loaded)
+        self._tts_playback_load_failed.connect(self._on_tts_playback_load_failed)
         self._dialogue_reply.connect(self._on_dialogue_reply)
         self._dialogue_error.connect(self._on_dialogue_error)
 
         self.tray = None
+        self.btn_quick_listen = None
+        self.combo_output_history = None
+        self._output_text_cache: Optional[str] = None
         self._on_hotkeys_changed = None
         self._on_stt_settings_changed = None
         self._on_tts_settings_changed = None
@@ -90,11 +363,20 @@ class MainWindow(QMainWindow):
         self.stop_listening_after_copy = False
         self.keep_wrapping_parentheses = False
         self.dark_mode = False
+        self._theme_applied = False
+        self._min_width_cache_key: Optional[tuple] = None
+        self._min_width_cache_value = 0
         self._server_online = True
+        self._server_status_state: Optional[tuple[bool, bool]] = None
+        self._retry_button_state: Optional[tuple[bool, bool]] = None
         self._profiles = []
+        self._profiles_by_name: dict[str, dict] = {}
+        self._applied_profile: Optional[dict] = None
         self._updating_listening_profiles = False
         self._tts_profiles = []
-        self._output_history = []
+        self._tts_profiles_by_name: dict[str, dict] = {}
+        # Keyed by text in oldest-to-newest order, so re-adding a text moves it to the end.
+        self._output_history: dict[str, dict] = {}
         self._tts_last_audio_dir = ""
 
         central = QWidget()
@@ -115,46 +397,24 @@ class MainWindow(QMainWindow):
 
         # TTS panel (extracted widget)
         self.tts_panel = TTSPanel()
-        self.tts_panel.generate_requested.connect(self._on_tts_generate)
-        self.tts_panel.optimization_settings_changed.connect(self._on_tts_optimization_settings_changed)
-        self.tts_panel.use_output_requested.connect(self._load_tts_from_output)
-        self.tts_panel.save_audio_requested.connect(self._save_last_tts_audio)
-        self.tts_panel.open_saved_audio_requested.connect(self._open_saved_tts_audio)
-        self.tts_panel.tts_profile_selected.connect(self._on_tts_profile_selected)
-        self.tts_panel.play_pause_requested.connect(self._toggle_tts_playback)
-        self.tts_panel.stop_requested.connect(self._stop_tts_playback)
-        self.tts_panel.seek_requested.connect(self._seek_tts_playback)
-        self.tts_panel.speed_changed.connect(self._set_tts_playback_speed)
-        self.tts_panel.pitch_changed.connect(self._set_tts_playback_pitch)
-        self.tts_panel.api_speed_changed.connect(self._on_tts_api_speed_changed)
+        self._connect_panel("tts_panel")
         self.tabs.addTab(self.tts_panel, "Text to Speech")
         self.tabs.setTabIcon(1, ui_icon(self, "tab_tts"))
 
-        # Dialogue panel (OpenAI-compatible chat)
-        self.dialogue_panel = DialoguePanel()
-        self.dialogue_panel.send_requested.connect(self._on_dialogue_send)
-        self.dialogue_panel.reset_requested.connect(self._on_dialogue_reset)
-        self.dialogue_panel.use_output_requested.connect(self._load_dialogue_from_output)
-        self.dialogue_panel.model_changed.connect(self._on_dialogue_model_changed)
-        self.dialogue_panel.system_prompt_changed.connect(self._on_dialogue_system_prompt_changed)
-        self.dialogue_panel.history_mode_changed.connect(self._on_dialogue_history_mode_changed)
-        self.dialogue_panel.set_model(self.dialogue_service.client.model, emit=False)
-        self.dialogue_panel.set_system_prompt(self.dialogue_service.system_prompt, emit=False)
-        self.dialogue_panel.set_include_history(self.dialogue_service.include_history, emit=False)
-        self.tabs.addTab(self.dialogue_panel, "Dialogue")
+        # Dialogue panel (OpenAI-compatible chat) is built on first activation
+        self.dialogue_panel = None
+        self.tabs.addTab(QWidget(), "Dialogue")
         self.tabs.setTabIcon(2, ui_icon(self, "tab_dialogue"))
+        self._tab_builders = {2: self._build_dialogue_tab}
 
         # Settings panel (extracted widget)
         self.settings_panel = SettingsPanel()
-        self.settings_panel.hotkeys_save_requested.connect(self._on_hotkeys_saved)
-        self.settings_panel.stt_settings_changed.connect(self._on_stt_settings_from_panel)
-        self.settings_panel.tts_settings_changed.connect(self._on_tts_settings_from_panel)
-        self.settings_panel.profiles_changed.connect(self._on_profiles_from_panel)
-        self.settings_panel.tts_profiles_changed.connect(self._on_tts_profiles_from_panel)
-        self.settings_panel.ui_settings_changed.connect(self._on_ui_settings_from_panel)
+        self._connect_panel("settings_panel")
         self.tabs.addTab(self.settings_panel, "Settings")
         self.tabs.setTabIcon(3, ui_icon(self, "tab_settings"))
 
+        self.tabs.currentChanged.connect(self._lazy_build_tab)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         self.tabs.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Ignored)
         self.tabs.setMinimumHeight(100)
         self.main_splitter.addWidget(self.tabs)
@@ -166,8 +426,49 @@ class MainWindow(QMainWindow):
         self.main_splitter.setCollapsible(0, True)
         self.main_splitter.setCollapsible(1, True)
 
-        self._apply_theme()
-        self.statusBar().showMessage("Ready")
+        # attach_ui_settings() normally styles the window before the event
+        # loop starts; only fall back to the default theme if it did not.
+        QTimer.singleShot(0, self._apply_initial_theme)
+        self.setUpdatesEnabled(True)
+        self._show_status("Ready")
+
+    # ── Lazy tabs ──────────────────────────────────────────────────
+
+    @pyqtSlot(int)
+    def _lazy_build_tab(self, index: int):
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        icon = self.tabs.tabIcon(index)
+        label = self.tabs.tabText(index)
+        placeholder = self.tabs.widget(index)
+        with QSignalBlocker(self.tabs):
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, builder(), icon, label)
+            self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+
+    def _connect_panel(self, panel_name: str):
+        panel = getattr(self, panel_name)
+        for signal_name, slot_name in _PANEL_CONNECTIONS[panel_name]:
+            getattr(panel, signal_name).connect(getattr(self, slot_name))
+
+    def _build_dialogue_tab(self):
+        self.dialogue_panel = dialogue_panel = DialoguePanel()
+        self._connect_panel("dialogue_panel")
+        dialogue_panel.set_model(self.dialogue_service.client.model, emit=False)
+        dialogue_panel.set_system_prompt(self.dialogue_service.system_prompt, emit=False)
+        dialogue_panel.set_include_history(self.dialogue_service.include_history, emit=False)
+        return dialogue_panel
+
+    # ── Status bar ─────────────────────────────────────────────────
+
+    def _show_status(self, message: str):
+        status_bar = self.statusBar()
+        # Skip the repaint when a state change reports the same text again.
+        if status_bar.currentMessage() == message:
+            return
+        status_bar.showMessage(message)
 
     # ── Output panel ───────────────────────────────────────────────
 
@@ -180,9 +481,11 @@ class MainWindow(QMainWindow):
         self.output_label = QLabel("Transcription Output:")
         layout.addWidget(self.output_label)
 
-        self.text_output = QTextEdit()
+        # Plain text only: skips QTextEdit's rich-text layout on long transcription sessions.
+        self.text_output = QPlainTextEdit()
         self.text_output.setReadOnly(False)
         self.text_output.setPlaceholderText("Transcription output appears here. You can edit it directly.")
+        self.text_output.textChanged.connect(self._invalidate_output_text)
         layout.addWidget(self.text_output)
 
         history_row = QHBoxLayout()
@@ -191,7 +494,9 @@ class MainWindow(QMainWindow):
         self.combo_output_history.setEditable(False)
         self.combo_output_history.setMinimumContentsLength(26)
         self.combo_output_history.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToContentsOnFirstShow)
+        self.combo_output_history.setToolTip("Last three transcription outputs")
         self.btn_restore_output = QPushButton("Restore")
+        self.btn_restore_output.setToolTip("Restore selected output to editor")
         self.btn_restore_output.clicked.connect(self._restore_selected_output)
         history_row.addWidget(self.combo_output_history, 1)
         history_row.addWidget(self.btn_restore_output)
@@ -199,6 +504,8 @@ class MainWindow(QMainWindow):
 
         btn_row = QHBoxLayout()
         self.btn_quick_listen = QPushButton("Listen")
+        self.btn_quick_listen.setProperty("role", "capture-listen")
+        self.btn_quick_listen.setProperty("state", "idle")
         self.btn_quick_listen.clicked.connect(self._toggle_quick_listening)
         self.btn_quick_listen.setIcon(ui_icon(self, "tab_listening"))
         self.btn_quick_listen.setToolTip("Start/stop listening mode")
@@ -250,14 +557,15 @@ class MainWindow(QMainWindow):
 
     def attach_tts_settings(self, settings: dict, on_tts_settings_changed=None):
         self._on_tts_settings_changed = on_tts_settings_changed
+        speed_raw = settings.get("tts_speed", self.tts_service.client.speed)
         self.settings_panel.apply_tts_settings(
             model=settings.get("tts_model", self.tts_service.client.model),
             voice=settings.get("tts_voice", self.tts_service.client.voice),
             language=settings.get("tts_language", self.tts_service.client.language),
             response_format=settings.get("tts_response_format", self.tts_service.client.response_format),
-            speed=str(settings.get("tts_speed", self.tts_service.client.speed)),
+            speed=str(speed_raw),
         )
-        self.tts_panel.set_api_speed(self._coerce_tts_speed_value(settings.get("tts_speed", self.tts_service.client.speed)) or 1.0)
+        self.tts_panel.set_api_speed(self._coerce_tts_speed_value(speed_raw) or 1.0)
         threshold_raw = settings.get("tts_optimize_threshold_chars", 240)
         try:
             threshold_chars = int(threshold_raw)
@@ -275,9 +583,14 @@ class MainWindow(QMainWindow):
         system_prompt = str(settings.get("chat_system_prompt", self.dialogue_service.system_prompt)).strip()
         include_history = bool(settings.get("chat_include_history", True))
 
-        self.dialogue_panel.set_model(model, emit=False)
-        self.dialogue_panel.set_system_prompt(system_prompt, emit=False)
-        self.dialogue_panel.set_include_history(include_history, emit=False)
+        if self.dialogue_panel is not None:
+            self.dialogue_panel.setUpdatesEnabled(False)
+            try:
+                self.dialogue_panel.set_model(model, emit=False)
+                self.dialogue_panel.set_system_prompt(system_prompt, emit=False)
+                self.dialogue_panel.set_include_history(include_history, emit=False)
+            finally:
+                self.dialogue_panel.setUpdatesEnabled(True)
         self.dialogue_service.update_settings(
             model=model,
             system_prompt=system_prompt,
@@ -288,11 +601,7 @@ class MainWindow(QMainWindow):
     def attach_profiles(self, settings: dict, on_profiles_changed=None):
         self._on_profiles_changed = on_profiles_changed
         profiles = settings.get("profiles", [])
-        self._profiles = [
-            dict(p)
-            for p in profiles
-            if isinstance(p, dict) and isinstance(p.get("name"), str) and p["name"].strip()
-        ]
+        self._profiles = self._normalize_profiles(profiles)
         if not self._profiles:
             self._profiles = [
                 {
@@ -309,6 +618,7 @@ class MainWindow(QMainWindow):
                     "tts_speed": str(self.tts_service.client.speed),
                 }
             ]
+        self._profiles_by_name = self._index_profiles(self._profiles)
         active_name = str(settings.get("active_profile", "")).strip() or self._profiles[0]["name"]
         self.settings_panel.apply_profiles(self._profiles, active_name)
         self._set_listening_profiles(self._profiles, active_name)
@@ -316,11 +626,7 @@ class MainWindow(QMainWindow):
     def attach_tts_profiles(self, settings: dict, on_tts_profiles_changed=None):
         self._on_tts_profiles_changed = on_tts_profiles_changed
         profiles = settings.get("tts_profiles", [])
-        self._tts_profiles = [
-            dict(p)
-            for p in profiles
-            if isinstance(p, dict) and isinstance(p.get("name"), str) and p["name"].strip()
-        ]
+        self._tts_profiles = self._normalize_profiles(profiles)
         if not self._tts_profiles:
             self._tts_profiles = [
                 {
@@ -334,6 +640,7 @@ class MainWindow(QMainWindow):
                     "tts_speed": str(self.tts_service.client.speed),
                 }
             ]
+        self._tts_profiles_by_name = self._index_profiles(self._tts_profiles)
         active_name = str(settings.get("active_tts_profile", "")).strip() or self._tts_profiles[0]["name"]
         self.settings_panel.apply_tts_profiles(self._tts_profiles, active_name)
         self.tts_panel.set_tts_profiles(self._tts_profiles, active_name)
@@ -346,7 +653,6 @@ class MainWindow(QMainWindow):
         self._apply_theme()
         self._set_server_status(self._server_online)
         self._sync_retry_last_failed_button()
-        self._refresh_capture_button_styles()
         raw = str(settings.get("ui_splitter_sizes", "560,340")).strip()
         try:
             parts = [int(x.strip()) for x in raw.split(",") if x.strip()]
@@ -361,23 +667,21 @@ class MainWindow(QMainWindow):
     def _build_capture_tab(self):
         tab = QWidget()
         layout = QVBoxLayout(tab)
-        layout.addWidget(self._wrap_capture_section("Listening (Automatic VAD)", self._build_listening_tab()))
-        layout.addWidget(self._wrap_capture_section("Recording (Manual)", self._build_recording_tab()))
-        layout.addWidget(self._wrap_capture_section("File Transcription", self._build_file_tab()))
+        layout.addWidget(self._build_listening_tab())
+        layout.addWidget(self._build_recording_tab())
+        layout.addWidget(self._build_file_tab())
         layout.addStretch()
         return tab
 
     @staticmethod
-    def _wrap_capture_section(title: str, content: QWidget) -> QGroupBox:
+    def _new_capture_section(title: str) -> tuple[QGroupBox, QVBoxLayout]:
         section = QGroupBox(title)
-        section_layout = QVBoxLayout(section)
-        section_layout.setContentsMargins(10, 10, 10, 10)
-        section_layout.addWidget(content)
-        return section
+        layout = QVBoxLayout(section)
+        layout.setContentsMargins(10, 10, 10, 10)
+        return section, layout
 
     def _build_listening_tab(self):
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
+        tab, layout = self._new_capture_section("Listening (Automatic VAD)")
 
         profile_row = QHBoxLayout()
         profile_row.setSpacing(8)
@@ -414,6 +718,8 @@ class MainWindow(QMainWindow):
         layout.addLayout(profile_row)
 
         self.btn_listen_toggle = QPushButton("Start Listening")
+        self.btn_listen_toggle.setProperty("role", "capture-listen")
+        self.btn_listen_toggle.setProperty("state", "idle")
         self.btn_listen_toggle.setCheckable(True)
         self.btn_listen_toggle.clicked.connect(self._toggle_listening)
         layout.addWidget(self.btn_listen_toggle)
@@ -421,6 +727,7 @@ class MainWindow(QMainWindow):
         self._sync_retry_last_failed_button()
         return tab
 
+    @pyqtSlot(bool)
     def _toggle_listening(self, checked):
         if checked:
             self._start_listening()
@@ -442,13 +749,13 @@ class MainWindow(QMainWindow):
         self._sync_listening_ui(self.stt_service.is_listening())
 
     def _sync_listening_ui(self, listening: bool):
-        self.btn_listen_toggle.blockSignals(True)
-        self.btn_listen_toggle.setChecked(listening)
-        self.btn_listen_toggle.blockSignals(False)
+        if self.btn_listen_toggle.isChecked() != listening:
+            with QSignalBlocker(self.btn_listen_toggle):
+                self.btn_listen_toggle.setChecked(listening)
         self.btn_listen_toggle.setText("Stop Listening" if listening else "Start Listening")
         self._set_listening_button_style(listening)
         self._sync_quick_listen_button(listening)
-        self.statusBar().showMessage("Listening (VAD)..." if listening else "Ready")
+        self._show_status("Listening (VAD)..." if listening else "Ready")
         if self.tray:
             self.tray.set_state("listening" if listening else "idle")
             self.tray.action_listen.setText("Stop Listening" if listening else "Start Listening")
@@ -456,13 +763,15 @@ class MainWindow(QMainWindow):
     # ── Recording tab ──────────────────────────────────────────────
 
     def _build_recording_tab(self):
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
+        tab, layout = self._new_capture_section("Recording (Manual)")
         btn_row = QHBoxLayout()
 
         self.btn_rec_start = QPushButton("Start")
         self.btn_rec_pause = QPushButton("Pause")
         self.btn_rec_stop = QPushButton("Stop")
+        self.btn_rec_start.setProperty("role", "rec-start")
+        self.btn_rec_pause.setProperty("role", "rec-pause")
+        self.btn_rec_stop.setProperty("role", "rec-stop")
         self.btn_rec_pause.setEnabled(False)
         self.btn_rec_stop.setEnabled(False)
 
@@ -476,35 +785,39 @@ class MainWindow(QMainWindow):
         layout.addLayout(btn_row)
         return tab
 
+    @pyqtSlot()
     def _rec_start(self):
         self.stt_service.start_recording()
         self.btn_rec_start.setEnabled(False)
         self.btn_rec_pause.setEnabled(True)
         self.btn_rec_stop.setEnabled(True)
-        self.statusBar().showMessage("Recording...")
+        self._show_status("Recording...")
         if self.tray:
             self.tray.set_state("recording")
 
+    @pyqtSlot()
     def _rec_pause(self):
         if self.btn_rec_pause.text() == "Pause":
             self.stt_service.pause_recording()
             self.btn_rec_pause.setText("Resume")
-            self.statusBar().showMessage("Recording paused")
+            self._show_status("Recording paused")
         else:
             self.stt_service.resume_recording()
             self.btn_rec_pause.setText("Pause")
-            self.statusBar().showMessage("Recording...")
+            self._show_status("Recording...")
 
+    @pyqtSlot()
     def _rec_stop(self):
         self.stt_service.stop_recording_and_transcribe()
         self.btn_rec_start.setEnabled(True)
         self.btn_rec_pause.setEnabled(False)
         self.btn_rec_stop.setEnabled(False)
         self.btn_rec_pause.setText("Pause")
-        self.statusBar().showMessage("Transcribing...")
+        self._show_status("Transcribing...")
         if self.tray:
             self.tray.set_state("idle")
 
+    @pyqtSlot()
     def _toggle_quick_listening(self):
         if self.stt_service.is_listening():
             self._stop_listening()
@@ -512,7 +825,7 @@ class MainWindow(QMainWindow):
             self._start_listening()
 
     def _sync_quick_listen_button(self, listening: bool):
-        if not hasattr(self, "btn_quick_listen"):
+        if self.btn_quick_listen is None:
             return
         if listening:
             self.btn_quick_listen.setText("Stop Listen")
@@ -524,11 +837,11 @@ class MainWindow(QMainWindow):
     # ── File tab ───────────────────────────────────────────────────
 
     def _build_file_tab(self):
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
+        tab, layout = self._new_capture_section("File Transcription")
 
         file_row = QHBoxLayout()
         self.btn_select_file = QPushButton("Select File")
+        self.btn_select_file.setProperty("role", "file-select")
         self.file_label = QLabel("No file selected")
         self.btn_select_file.clicked.connect(self._select_file)
         file_row.addWidget(self.btn_select_file)
@@ -536,6 +849,7 @@ class MainWindow(QMainWindow):
         layout.addLayout(file_row)
 
         self.btn_transcribe_file = QPushButton("Transcribe")
+        self.btn_transcribe_file.setProperty("role", "file-transcribe")
         self.btn_transcribe_file.setEnabled(False)
         self.btn_transcribe_file.clicked.connect(self._transcribe_file)
         layout.addWidget(self.btn_transcribe_file)
@@ -543,29 +857,30 @@ class MainWindow(QMainWindow):
         self._selected_file = None
         return tab
 
+    @pyqtSlot()
     def _select_file(self):
-        path, _ = QFileDialog.getOpenFileName(
-            self, "Select Audio File", "",
-            "Audio Files (*.mp3 *.wav *.flac *.m4a *.ogg);;All Files (*)"
-        )
+        path, _ = QFileDialog.getOpenFileName(self, "Select Audio File", "", STT_FILE_FILTER)
         if path:
             self._selected_file = path
-            self.file_label.setText(path.rsplit("/", 1)[-1] if "/" in path else path.rsplit("\\", 1)[-1])
+            self.file_label.setText(Path(path).name)
             self.btn_transcribe_file.setEnabled(True)
 
+    @pyqtSlot()
     def _transcribe_file(self):
         if not self._selected_file:
             return
-        self.statusBar().showMessage("Transcribing file...")
+        self._show_status("Transcribing file...")
         self.stt_service.transcribe_file(self._selected_file)
 
     # ── Settings panel signal handlers ─────────────────────────────
 
+    @pyqtSlot(str, str)
     def _on_hotkeys_saved(self, listen_hotkey: str, record_hotkey: str):
         if self._on_hotkeys_changed:
             self._on_hotkeys_changed(listen_hotkey, record_hotkey)
-        self.statusBar().showMessage("Hotkeys updated")
+        self._show_status("Hotkeys updated")
 
+    @pyqtSlot(dict)
     def _on_stt_settings_from_panel(self, settings: dict):
         self.stt_service.update_settings(
             language=settings.get("stt_language"),
@@ -579,26 +894,29 @@ class MainWindow(QMainWindow):
         self.keep_wrapping_parentheses = bool(settings.get("keep_wrapping_parentheses", False))
         if self._on_stt_settings_changed:
             self._on_stt_settings_changed(settings)
-        self.statusBar().showMessage("STT settings updated")
+        self._show_status("STT settings updated")
 
+    @pyqtSlot(dict)
     def _on_tts_settings_from_panel(self, settings: dict):
-        settings_clean = {k: v for k, v in settings.items() if not str(k).startswith("_")}
-        silent = bool(settings.get("_silent"))
+        settings_clean = dict(settings)
+        silent = bool(settings_clean.pop("_silent", False))
+        speed = self._coerce_tts_speed_value(settings_clean.get("tts_speed"))
         self.tts_service.update_settings(
             model=settings_clean.get("tts_model"),
             voice=settings_clean.get("tts_voice"),
             language=settings_clean.get("tts_language"),
             response_format=settings_clean.get("tts_response_format"),
-            speed=self._coerce_tts_speed_value(settings_clean.get("tts_speed")),
+            speed=speed,
         )
-        self.tts_panel.set_api_speed(self._coerce_tts_speed_value(settings_clean.get("tts_speed")) or 1.0)
+        self.tts_panel.set_api_speed(speed or 1.0)
         settings_clean["tts_optimize_long_text"] = self.tts_panel.should_optimize_long_text()
         settings_clean["tts_optimize_threshold_chars"] = self.tts_panel.get_optimize_threshold_chars()
         if self._on_tts_settings_changed and not silent:
             self._on_tts_settings_changed(settings_clean)
         if not silent:
-            self.statusBar().showMessage("TTS settings updated")
+            self._show_status("TTS settings updated")
 
+    @pyqtSlot(bool, int)
     def _on_tts_optimization_settings_changed(self, enabled: bool, threshold_chars: int):
         if self._on_tts_settings_changed:
             self._on_tts_settings_changed(
@@ -608,6 +926,7 @@ class MainWindow(QMainWindow):
                 }
             )
 
+    @pyqtSlot(dict)
     def _on_ui_settings_from_panel(self, settings: dict):
         dark_mode = bool(settings.get("dark_mode", False))
         changed = dark_mode != self.dark_mode
@@ -616,18 +935,15 @@ class MainWindow(QMainWindow):
             self._apply_theme()
             self._set_server_status(self._server_online)
             self._sync_retry_last_failed_button()
-            self._refresh_capture_button_styles()
-            self.statusBar().showMessage("Theme updated")
+            self._show_status("Theme updated")
         if self._on_ui_settings_changed:
             self._on_ui_settings_changed({"dark_mode": self.dark_mode})
 
+    @pyqtSlot(dict)
     def _on_profiles_from_panel(self, profile_data: dict):
         profiles = profile_data.get("profiles", [])
-        self._profiles = [
-            dict(p)
-            for p in profiles
-            if isinstance(p, dict) and isinstance(p.get("name"), str) and p["name"].strip()
-        ]
+        self._profiles = self._normalize_profiles(profiles)
+        self._profiles_by_name = self._index_profiles(self._profiles)
         if not self._profiles:
             return
         active_name = str(profile_data.get("active_profile", "")).strip() or self._profiles[0]["name"]
@@ -640,27 +956,46 @@ class MainWindow(QMainWindow):
                     "active_profile": active_name,
                 }
             )
-        self.statusBar().showMessage("Profiles updated")
+        self._show_status("Profiles updated")
 
     def _set_listening_profiles(self, profiles: list[dict], active_name: str):
-        names = [str(p.get("name", "")).strip() for p in profiles if isinstance(p, dict) and str(p.get("name", "")).strip()]
+        names = [profile["name"] for profile in profiles]
         self._updating_listening_profiles = True
-        self.combo_listening_profiles.clear()
-        for name in names:
-            self.combo_listening_profiles.addItem(name)
-        idx = self.combo_listening_profiles.findText(active_name)
-        self.combo_listening_profiles.setCurrentIndex(idx if idx >= 0 else 0)
-        self.combo_listening_profiles.setEnabled(bool(names))
-        self._updating_listening_profiles = False
+        try:
+            self._replace_combo_items(self.combo_listening_profiles, names)
+            idx = self.combo_listening_profiles.findText(active_name)
+            self.combo_listening_profiles.setCurrentIndex(idx if idx >= 0 else 0)
+            self.combo_listening_profiles.setEnabled(bool(names))
+        finally:
+            self._updating_listening_profiles = False
+
+    @staticmethod
+    def _replace_combo_items(combo: QComboBox, items: list[str]):
+        """Refill a combo box, leaving it untouched when the items already match."""
+        if combo.count() == len(items) and all(combo.itemText(i) == text for i, text in enumerate(items)):
+            return
+        combo.clear()
+        combo.addItems(items)
+
+    @staticmethod
+    def _normalize_profiles(profiles) -> list[dict]:
+        """Copy valid profiles with their names stripped once on ingest."""
+        return [
+            dict(p, name=p["name"].strip())
+            for p in profiles
+            if isinstance(p, dict) and isinstance(p.get("name"), str) and p["name"].strip()
+        ]
+
+    @staticmethod
+    def _index_profiles(profiles: list[dict]) -> dict[str, dict]:
+        # Reversed so the first profile wins when names collide.
+        return {profile["name"]: profile for profile in reversed(profiles)}
 
     def _find_profile_by_name(self, name: str):
         target = (name or "").strip()
         if not target:
             return None
-        for profile in self._profiles:
-            if str(profile.get("name", "")).strip() == target:
-                return profile
-        return None
+        return self._profiles_by_name.get(target)
 
     def _apply_profile_by_name(self, profile_name: str, persist: bool, sync_settings_panel: bool, status_message: bool) -> bool:
         name = (profile_name or "").strip()
@@ -669,9 +1004,13 @@ class MainWindow(QMainWindow):
         profile = self._find_profile_by_name(name)
         if not profile:
             return False
-        self.combo_listening_profiles.blockSignals(True)
-        self.combo_listening_profiles.setCurrentText(name)
-        self.combo_listening_profiles.blockSignals(False)
+        if not (persist or sync_settings_panel or status_message) and profile == self._applied_profile:
+            # Profile list refreshes re-send the active profile; services already match it.
+            return True
+        if self.combo_listening_profiles.currentText() != name:
+            with QSignalBlocker(self.combo_listening_profiles):
+                self.combo_listening_profiles.setCurrentText(name)
+        self._applied_profile = dict(profile)
         if sync_settings_panel:
             self.settings_panel.set_active_profile(name)
             self.settings_panel.apply_profile(profile)
@@ -698,9 +1037,10 @@ class MainWindow(QMainWindow):
                 }
             )
         if status_message:
-            self.statusBar().showMessage(f"Listening profile applied: {name}")
+            self._show_status(f"Listening profile applied: {name}")
         return True
 
+    @pyqtSlot(str)
     def _on_listening_profile_selected(self, profile_name: str):
         if self._updating_listening_profiles:
             return
@@ -711,13 +1051,11 @@ class MainWindow(QMainWindow):
             status_message=True,
         )
 
+    @pyqtSlot(dict)
     def _on_tts_profiles_from_panel(self, profile_data: dict):
         profiles = profile_data.get("tts_profiles", [])
-        self._tts_profiles = [
-            dict(p)
-            for p in profiles
-            if isinstance(p, dict) and isinstance(p.get("name"), str) and p["name"].strip()
-        ]
+        self._tts_profiles = self._normalize_profiles(profiles)
+        self._tts_profiles_by_name = self._index_profiles(self._tts_profiles)
         if not self._tts_profiles:
             return
         active_name = str(profile_data.get("active_tts_profile", "")).strip() or self._tts_profiles[0]["name"]
@@ -730,13 +1068,10 @@ class MainWindow(QMainWindow):
                     "active_tts_profile": active_name,
                 }
             )
-        self.statusBar().showMessage("TTS profiles updated")
+        self._show_status("TTS profiles updated")
 
     def _find_tts_profile_by_name(self, name: str):
-        for profile in self._tts_profiles:
-            if str(profile.get("name", "")).strip() == name:
-                return profile
-        return None
+        return self._tts_profiles_by_name.get(name)
 
     def _apply_tts_profile_by_name(
         self,
@@ -772,9 +1107,10 @@ class MainWindow(QMainWindow):
                 }
             )
         if status_message:
-            self.statusBar().showMessage(f"TTS profile applied: {name}")
+            self._show_status(f"TTS profile applied: {name}")
         return True
 
+    @pyqtSlot(str)
     def _on_tts_profile_selected(self, profile_name: str):
         self._apply_tts_profile_by_name(
             profile_name,
@@ -785,12 +1121,13 @@ class MainWindow(QMainWindow):
 
     # ── Service callbacks (run on main thread via signals) ─────────
 
+    @pyqtSlot(object)
     def _on_transcription_done(self, text):
         self._set_server_status(True)
         self._sync_retry_last_failed_button()
         display_text = self._format_transcription_text(text)
         self._append_output_text(display_text)
-        self._remember_output_snapshot(self.text_output.toPlainText(), source_label="Transcription")
+        self._remember_output_snapshot(self._output_text(), source_label="Transcription")
         if self.auto_copy_transcription:
             copy_to_clipboard(display_text)
             output_cleared, listening_stopped = self._apply_post_copy_actions()
@@ -799,10 +1136,11 @@ class MainWindow(QMainWindow):
                 status += ", output cleared"
             if listening_stopped:
                 status += ", listening stopped"
-            self.statusBar().showMessage(status)
+            self._show_status(status)
         else:
-            self.statusBar().showMessage("Transcription complete")
+            self._show_status("Transcription complete")
 
+    @pyqtSlot(object)
     def _on_transcription_error(self, err):
         logger.error("Transcription failed: %s", err)
         self._append_output_text(f"[ERROR] {err}")
@@ -810,55 +1148,51 @@ class MainWindow(QMainWindow):
             self._set_server_status(False, str(err))
         self._sync_retry_last_failed_button()
         if "saved to '" in str(err):
-            self.statusBar().showMessage("Transcription failed — audio was backed up locally")
+            self._show_status("Transcription failed — audio was backed up locally")
         else:
-            self.statusBar().showMessage("Transcription failed")
+            self._show_status("Transcription failed")
 
+    @pyqtSlot(object)
     def _on_tts_done_play(self, audio_bytes: bytes):
         self.tts_panel.set_generate_enabled(True)
         self.tts_panel.set_save_enabled(bool(audio_bytes))
         if not audio_bytes:
-            self.statusBar().showMessage("TTS returned empty audio")
+            self._show_status("TTS returned empty audio")
             return
         audio_format = detect_audio_format(audio_bytes)
         if audio_format != "wav":
             self.tts_panel.set_playback_available(False)
             self.tts_panel.set_playing(False)
             self._tts_ui_timer.stop()
-            self.statusBar().showMessage(
+            self._show_status(
                 f"TTS generated {audio_format.upper()} audio; in-app playback supports WAV only. "
                 "Set TTS response format to wav for Generate & Play."
             )
             return
-        try:
-            self.tts_playback.load_wav_bytes(audio_bytes)
-            self.tts_playback.set_speed(self.tts_panel.get_playback_speed())
-            self.tts_playback.set_pitch_semitones(self.tts_panel.get_playback_pitch())
-            duration = self.tts_playback.get_duration_seconds()
-            self.tts_panel.set_playback_available(True)
-            self.tts_panel.set_duration(duration)
-            self.tts_playback.play()
-            self.tts_panel.set_playing(True)
-            self._tts_ui_timer.start()
-            self.statusBar().showMessage("Speech generated and playing")
-        except Exception as e:
-            self.statusBar().showMessage(f"TTS generated (playback failed): {e}")
+        self._start_tts_playback_load(
+            audio_bytes,
+            "Speech generated and playing",
+            "TTS generated (playback failed)",
+        )
 
+    @pyqtSlot(str)
     def _on_tts_error(self, err: str):
         logger.error("TTS failed: %s", err)
         self.tts_panel.set_generate_enabled(True)
-        self.statusBar().showMessage(f"TTS failed: {err}")
+        self._show_status(f"TTS failed: {err}")
 
+    @pyqtSlot(str)
     def _on_dialogue_reply(self, text: str):
         self.dialogue_panel.set_busy(False)
         self.dialogue_panel.append_assistant(text)
-        self.statusBar().showMessage("Dialogue response ready")
+        self._show_status("Dialogue response ready")
 
+    @pyqtSlot(str)
     def _on_dialogue_error(self, err: str):
         logger.error("Dialogue failed: %s", err)
         self.dialogue_panel.set_busy(False)
         self.dialogue_panel.append_error(err)
-        self.statusBar().showMessage(f"Dialogue failed: {err}")
+        self._show_status(f"Dialogue failed: {err}")
 
     # ── TTS actions ────────────────────────────────────────────────
 
@@ -878,21 +1212,22 @@ class MainWindow(QMainWindow):
             )
             return True
         except Exception as e:
-            self.statusBar().showMessage(f"TTS settings error: {e}")
+            self._show_status(f"TTS settings error: {e}")
             return False
 
+    @pyqtSlot(str)
     def _on_tts_generate(self, text: str):
         if not self._sync_tts_settings_from_panel():
             return
-        response_format = str(self.tts_service.client.response_format or "").strip().lower() or "unknown"
+        response_format = self.tts_service.normalized_response_format
         optimize_long_text = self.tts_panel.should_optimize_long_text()
         threshold_chars = self.tts_panel.get_optimize_threshold_chars()
         self.tts_panel.set_generate_enabled(False)
         self._stop_tts_playback(update_status=False)
         if response_format == "wav":
-            self.statusBar().showMessage("Generating speech...")
+            self._show_status("Generating speech...")
         else:
-            self.statusBar().showMessage(
+            self._show_status(
                 f"Generating {response_format.upper()} audio (playback controls require WAV)."
             )
         self.tts_service.synthesize(
@@ -901,29 +1236,24 @@ class MainWindow(QMainWindow):
             long_text_threshold_chars=threshold_chars,
         )
 
+    @pyqtSlot()
     def _load_tts_from_output(self):
-        text = self.text_output.toPlainText().strip()
+        text = self._output_text().strip()
         if not text:
-            self.statusBar().showMessage("No transcription output to load")
+            self._show_status("No transcription output to load")
             return
         self.tts_panel.set_text(text)
-        self.statusBar().showMessage("Loaded transcription output into TTS")
+        self._show_status("Loaded transcription output into TTS")
 
+    @pyqtSlot()
     def _save_last_tts_audio(self):
         audio = self.tts_service.get_last_audio()
         if not audio:
-            self.statusBar().showMessage("No TTS audio to save")
+            self._show_status("No TTS audio to save")
             return
         fmt = detect_audio_format(audio)
-        default_ext = fmt if fmt in {"wav", "flac", "mp3", "ogg"} else "wav"
-        if default_ext == "wav":
-            dialog_filter = "WAV Audio (*.wav);;All Files (*)"
-        elif default_ext == "flac":
-            dialog_filter = "FLAC Audio (*.flac);;All Files (*)"
-        elif default_ext == "mp3":
-            dialog_filter = "MP3 Audio (*.mp3);;All Files (*)"
-        else:
-            dialog_filter = "OGG Audio (*.ogg);;All Files (*)"
+        default_ext = fmt if fmt in TTS_SAVE_FILTERS else "wav"
+        dialog_filter = TTS_SAVE_FILTERS[default_ext]
         default_name = f"tts_output.{default_ext}"
         if self._tts_last_audio_dir:
             default_path = str(Path(self._tts_last_audio_dir) / default_name)
@@ -938,16 +1268,17 @@ class MainWindow(QMainWindow):
             with open(path, "wb") as f:
                 f.write(audio)
             self._tts_last_audio_dir = str(Path(path).parent)
-            self.statusBar().showMessage("TTS audio saved")
+            self._show_status("TTS audio saved")
         except OSError as e:
-            self.statusBar().showMessage(f"Failed to save audio: {e}")
+            self._show_status(f"Failed to save audio: {e}")
 
+    @pyqtSlot()
     def _open_saved_tts_audio(self):
         path, _ = QFileDialog.getOpenFileName(
             self,
             "Open Saved TTS Audio",
             self._tts_last_audio_dir,
-            "Audio Files (*.wav *.flac *.mp3 *.ogg);;WAV Audio (*.wav);;All Files (*)",
+            TTS_OPEN_FILTER,
         )
         if not path:
             return
@@ -956,7 +1287,7 @@ class MainWindow(QMainWindow):
             with open(path, "rb") as f:
                 audio_bytes = f.read()
         except OSError as e:
-            self.statusBar().showMessage(f"Failed to open audio file: {e}")
+            self._show_status(f"Failed to open audio file: {e}")
             return
 
         self._tts_last_audio_dir = str(Path(path).parent)
@@ -965,60 +1296,118 @@ class MainWindow(QMainWindow):
             self.tts_panel.set_playback_available(False)
             self.tts_panel.set_playing(False)
             self._tts_ui_timer.stop()
-            self.statusBar().showMessage(
+            self._show_status(
                 f"Loaded {audio_format.upper()} file. In-app playback supports WAV only."
             )
             return
 
+        self._stop_tts_playback(update_status=False)
+        self._start_tts_playback_load(
+            audio_bytes,
+            f"Loaded and playing: {Path(path).name}",
+            "Failed to load audio",
+        )
+
+    def _start_tts_playback_load(self, audio_bytes: bytes, playing_status: str, failure_prefix: str):
+        """Decode WAV audio off the GUI thread, then install it in _on_tts_playback_loaded."""
+        try:
+            self._ensure_tts_playback()
+            from core.wav_playback import decode_wav_bytes
+        except Exception as e:
+            self._show_status(f"{failure_prefix}: {e}")
+            return
+        self._tts_load_token += 1
+        token = self._tts_load_token
+
+        def worker():
+            # Decode into a local result only; the controller is swapped on the GUI
+            # thread once the token is known to be current.
+            if token != self._tts_load_token:
+                return
+            try:
+                decoded = decode_wav_bytes(audio_bytes)
+            except Exception as e:
+                self._tts_playback_load_failed.emit(token, f"{failure_prefix}: {e}")
+                return
+            self._tts_playback_loaded.emit(token, decoded, playing_status)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    @pyqtSlot(int, object, str)
+    def _on_tts_playback_loaded(self, token: int, decoded: tuple, playing_status: str):
+        if token != self._tts_load_token:
+            return
+        self.tts_playback.load_decoded(*decoded)
+        self.tts_playback.set_speed(self.tts_panel.get_playback_speed())
+        self.tts_playback.set_pitch_semitones(self.tts_panel.get_playback_pitch())
+        self.tts_panel.set_playback_available(True)
+        self.tts_panel.set_duration(self.tts_playback.get_duration_seconds())
         try:
-            self._stop_tts_playback(update_status=False)
-            self.tts_playback.load_wav_bytes(audio_bytes)
-            self.tts_playback.set_speed(self.tts_panel.get_playback_speed())
-            self.tts_playback.set_pitch_semitones(self.tts_panel.get_playback_pitch())
-            duration = self.tts_playback.get_duration_seconds()
-            self.tts_panel.set_playback_available(True)
-            self.tts_panel.set_duration(duration)
             self.tts_playback.play()
-            self.tts_panel.set_playing(True)
-            self._tts_ui_timer.start()
-            self.statusBar().showMessage(f"Loaded and playing: {Path(path).name}")
         except Exception as e:
-            self.statusBar().showMessage(f"Failed to load audio: {e}")
+            self._show_status(f"Playback failed: {e}")
+            return
+        self.tts_panel.set_playing(True)
+        self._tts_ui_timer.start()
+        self._show_status(playing_status)
+
+    @pyqtSlot(int, str)
+    def _on_tts_playback_load_failed(self, token: int, message: str):
+        if token == self._tts_load_token:
+            self._show_status(message)
+
+    def _ensure_tts_playback(self):
+        if self.tts_playback is None:
+            from core.wav_playback import WavPlaybackController
+            self.tts_playback = WavPlaybackController()
 
+    def _has_tts_audio(self) -> bool:
+        return self.tts_playback is not None and self.tts_playback.has_audio()
+
+    @pyqtSlot()
     def _toggle_tts_playback(self):
-        if not self.tts_playback.has_audio():
+        if not self._has_tts_audio():
             return
         if self.tts_playback.is_playing():
             self.tts_playback.pause()
             self.tts_panel.set_playing(False)
             self._tts_ui_timer.stop()
-            self.statusBar().showMessage("Playback paused")
+            self._show_status("Playback paused")
         else:
             self.tts_playback.play()
             self.tts_panel.set_playing(True)
-            self.statusBar().showMessage("Playback playing")
+            self._show_status("Playback playing")
             self._tts_ui_timer.start()
 
+    @pyqtSlot()
     def _stop_tts_playback(self, update_status: bool = True):
+        self._tts_load_token += 1
         self._tts_ui_timer.stop()
-        self.tts_playback.stop()
+        if self.tts_playback is not None:
+            self.tts_playback.stop()
         self.tts_panel.set_playing(False)
         self.tts_panel.set_position(0.0)
         if update_status:
-            self.statusBar().showMessage("Playback stopped")
+            self._show_status("Playback stopped")
 
+    @pyqtSlot(float)
     def _seek_tts_playback(self, seconds: float):
-        if not self.tts_playback.has_audio():
+        if not self._has_tts_audio():
             return
         self.tts_playback.seek_seconds(seconds)
         self.tts_panel.set_position(self.tts_playback.get_position_seconds())
 
+    @pyqtSlot(float)
     def _set_tts_playback_speed(self, speed: float):
-        self.tts_playback.set_speed(speed)
+        if self.tts_playback is not None:
+            self.tts_playback.set_speed(speed)
 
+    @pyqtSlot(float)
     def _set_tts_playback_pitch(self, pitch: float):
-        self.tts_playback.set_pitch_semitones(pitch)
+        if self.tts_playback is not None:
+            self.tts_playback.set_pitch_semitones(pitch)
 
+    @pyqtSlot(float)
     def _on_tts_api_speed_changed(self, speed: float):
         speed_value = self._coerce_tts_speed_value(speed)
         if speed_value is None:
@@ -1029,6 +1418,8 @@ class MainWindow(QMainWindow):
     def _coerce_tts_speed_value(self, value) -> float | None:
         if value is None:
             return None
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
         raw = str(value).strip().replace(",", ".")
         if not raw:
             return None
@@ -1037,8 +1428,10 @@ class MainWindow(QMainWindow):
         except ValueError:
             return float(self.tts_service.client.speed)
 
+    @pyqtSlot()
     def _refresh_tts_playback_ui(self):
-        if not self.tts_playback.has_audio():
+        if not self._has_tts_audio() or not self.tts_panel.isVisible():
+            # Hidden panels are resynced by _resume_tts_playback_ui when shown again.
             self._tts_ui_timer.stop()
             return
         duration = self.tts_playback.get_duration_seconds()
@@ -1050,12 +1443,20 @@ class MainWindow(QMainWindow):
         if not playing:
             self._tts_ui_timer.stop()
 
+    def _resume_tts_playback_ui(self):
+        if not self._has_tts_audio() or not self.tts_panel.isVisible():
+            return
+        self._refresh_tts_playback_ui()
+        if self.tts_playback.is_playing():
+            self._tts_ui_timer.start()
+
     # ── Dialogue actions ───────────────────────────────────────────
 
+    @pyqtSlot(str)
     def _on_dialogue_send(self, text: str):
         message = (text or "").strip()
         if not message:
-            self.statusBar().showMessage("Dialogue message cannot be empty")
+            self._show_status("Dialogue message cannot be empty")
             return
 
         model = self.dialogue_panel.get_model()
@@ -1075,9 +1476,10 @@ class MainWindow(QMainWindow):
         )
         self.dialogue_panel.append_user(message)
         self.dialogue_panel.set_busy(True)
-        self.statusBar().showMessage("Generating dialogue response...")
+        self._show_status("Generating dialogue response...")
         self.dialogue_service.send(message)
 
+    @pyqtSlot()
     def _on_dialogue_reset(self):
         model = self.dialogue_panel.get_model()
         system_prompt = self.dialogue_panel.get_system_prompt()
@@ -1096,36 +1498,40 @@ class MainWindow(QMainWindow):
             }
         )
         self.dialogue_panel.clear_dialogue()
-        self.statusBar().showMessage("Dialogue history cleared")
+        self._show_status("Dialogue history cleared")
 
+    @pyqtSlot()
     def _load_dialogue_from_output(self):
-        text = self.text_output.toPlainText().strip()
+        text = self._output_text().strip()
         if not text:
-            self.statusBar().showMessage("No transcription output to load")
+            self._show_status("No transcription output to load")
             return
         self.dialogue_panel.set_input_text(text)
-        self.statusBar().showMessage("Loaded transcription output into Dialogue")
+        self._show_status("Loaded transcription output into Dialogue")
 
+    @pyqtSlot(str)
     def _on_dialogue_model_changed(self, model: str):
         self.dialogue_service.update_settings(model=model)
         self._persist_dialogue_settings({"chat_model": str(model or "").strip()})
 
+    @pyqtSlot(str)
     def _on_dialogue_system_prompt_changed(self, prompt: str):
         prompt_value = str(prompt or "").strip()
         self.dialogue_service.update_settings(system_prompt=prompt_value, reset_history=True)
         self.dialogue_panel.clear_dialogue()
         self._persist_dialogue_settings({"chat_system_prompt": prompt_value})
-        self.statusBar().showMessage("Dialogue system prompt updated")
+        self._show_status("Dialogue system prompt updated")
 
+    @pyqtSlot(bool)
     def _on_dialogue_history_mode_changed(self, enabled: bool):
         include_history = bool(enabled)
         self.dialogue_service.update_settings(include_history=include_history, reset_history=True)
         self.dialogue_panel.clear_dialogue()
         self._persist_dialogue_settings({"chat_include_history": include_history})
         if include_history:
-            self.statusBar().showMessage("Dialogue now includes conversation history")
+            self._show_status("Dialogue now includes conversation history")
         else:
-            self.statusBar().showMessage("Dialogue now sends each message independently")
+            self._show_status("Dialogue now sends each message independently")
 
     def _persist_dialogue_settings(self, payload: dict):
         if self._on_dialogue_settings_changed:
@@ -1134,13 +1540,13 @@ class MainWindow(QMainWindow):
     # ── Shared output logic ────────────────────────────────────────
 
     def _load_output_history(self, history_items):
-        entries = []
+        entries: dict[str, dict] = {}
         if isinstance(history_items, list):
             for item in history_items:
                 if not isinstance(item, dict):
                     continue
                 text = str(item.get("text", "")).strip()
-                if not text:
+                if not text or text in entries:
                     continue
                 created_at = str(item.get("created_at", "")).strip()
                 name = str(item.get("name", "")).strip() or self._build_output_history_name(
@@ -1148,16 +1554,15 @@ class MainWindow(QMainWindow):
                     created_at,
                     "Saved",
                 )
-                entries.append(
-                    {
-                        "name": name,
-                        "text": text,
-                        "created_at": created_at,
-                    }
-                )
+                entries[text] = {
+                    "name": name,
+                    "text": text,
+                    "created_at": created_at,
+                }
                 if len(entries) >= OUTPUT_HISTORY_LIMIT:
                     break
-        self._output_history = entries
+        # Saved history is newest first; store it oldest first.
+        self._output_history = dict(reversed(entries.items()))
         self._refresh_output_history_controls()
 
     def _remember_output_snapshot(self, text: str, source_label: str):
@@ -1166,58 +1571,78 @@ class MainWindow(QMainWindow):
             return
         now_iso = datetime.now().isoformat(timespec="seconds")
         name = self._build_output_history_name(cleaned, now_iso, source_label)
-        deduped = [item for item in self._output_history if item.get("text") != cleaned]
-        deduped.insert(
-            0,
-            {
-                "name": name,
-                "text": cleaned,
-                "created_at": now_iso,
-            },
-        )
-        self._output_history = deduped[:OUTPUT_HISTORY_LIMIT]
+        self._output_history.pop(cleaned, None)
+        self._output_history[cleaned] = {
+            "name": name,
+            "text": cleaned,
+            "created_at": now_iso,
+        }
+        while len(self._output_history) > OUTPUT_HISTORY_LIMIT:
+            del self._output_history[next(iter(self._output_history))]
         self._refresh_output_history_controls()
         self._persist_output_history()
 
     def _refresh_output_history_controls(self):
-        if not hasattr(self, "combo_output_history"):
+        if self.combo_output_history is None:
             return
-        self.combo_output_history.blockSignals(True)
-        self.combo_output_history.clear()
-        for item in self._output_history:
-            self.combo_output_history.addItem(str(item.get("name", "")).strip())
-        self.combo_output_history.blockSignals(False)
-        has_history = bool(self._output_history)
+        names = [item["name"] for item in reversed(self._output_history.values())]
+        with QSignalBlocker(self.combo_output_history):
+            self._replace_combo_items(self.combo_output_history, names)
+        has_history = bool(names)
         self.combo_output_history.setEnabled(has_history)
         self.btn_restore_output.setEnabled(has_history)
-        self.combo_output_history.setToolTip("Last three transcription outputs")
-        self.btn_restore_output.setToolTip("Restore selected output to editor")
+
+    def _output_history_entries(self) -> list[dict]:
+        """Return output history newest first, as shown in the combo box."""
+        return list(reversed(self._output_history.values()))
 
     def _persist_output_history(self):
+        # Transcription bursts each add a snapshot; write the settings file once they settle.
+        self._output_history_save_timer.start()
+
+    @pyqtSlot()
+    def _flush_pending_saves(self):
+        if self._splitter_save_timer.isActive():
+            self._flush_splitter_sizes()
+        if self._output_history_save_timer.isActive():
+            self._flush_output_history()
+
+    @pyqtSlot()
+    def _flush_output_history(self):
+        self._output_history_save_timer.stop()
         if self._on_ui_settings_changed:
             self._on_ui_settings_changed(
                 {
-                    "output_history": [dict(item) for item in self._output_history],
+                    "output_history": self._output_history_entries(),
                 }
             )
 
+    @pyqtSlot()
     def _restore_selected_output(self):
         index = self.combo_output_history.currentIndex()
         if index < 0 or index >= len(self._output_history):
-            self.statusBar().showMessage("No saved output selected")
+            self._show_status("No saved output selected")
             return
-        selected = self._output_history[index]
+        selected = self._output_history_entries()[index]
         text = str(selected.get("text", "")).strip()
         if not text:
-            self.statusBar().showMessage("Saved output is empty")
+            self._show_status("Saved output is empty")
             return
         self.text_output.setPlainText(text)
-        self.statusBar().showMessage(f"Restored output: {selected.get('name', 'Saved output')}")
+        self._show_status(f"Restored output: {selected.get('name', 'Saved output')}")
 
     @staticmethod
     def _build_output_history_name(text: str, created_at: str, source_label: str) -> str:
         stamp = MainWindow._format_history_stamp(created_at)
-        preview = " ".join(str(text).split())
+        # Same as " ".join(text.split()), but stop reading words once the preview is full.
+        words = []
+        length = -1
+        for match in _WORD_RE.finditer(str(text)):
+            words.append(match.group())
+            length += len(words[-1]) + 1
+            if length > OUTPUT_HISTORY_PREVIEW_CHARS:
+                break
+        preview = " ".join(words)
         if len(preview) > OUTPUT_HISTORY_PREVIEW_CHARS:
             preview = f"{preview[:OUTPUT_HISTORY_PREVIEW_CHARS].rstrip()}..."
         return f"{source_label} {stamp} | {preview}"
@@ -1227,14 +1652,13 @@ class MainWindow(QMainWindow):
         raw = str(created_at or "").strip()
         if not raw:
             return datetime.now().strftime("%Y-%m-%d %H:%M")
-        try:
-            return datetime.fromisoformat(raw).strftime("%Y-%m-%d %H:%M")
-        except ValueError:
-            normalized = raw.replace("T", " ")
-            return normalized[:16] if len(normalized) >= 16 else normalized
+        return _format_iso_stamp(raw)
 
+    @pyqtSlot()
     def _copy_output(self):
-        text = self.text_output.toPlainText()
+        if self._output_text_cache is None and self.text_output.document().isEmpty():
+            return
+        text = self._output_text()
         if text:
             QApplication.clipboard().setText(text)
             self._remember_output_snapshot(text, source_label="Copied")
@@ -1244,7 +1668,7 @@ class MainWindow(QMainWindow):
                 status += ", output cleared"
             if listening_stopped:
                 status += ", listening stopped"
-            self.statusBar().showMessage(status)
+            self._show_status(status)
 
     def _apply_post_copy_actions(self) -> tuple[bool, bool]:
         output_cleared = False
@@ -1267,49 +1691,36 @@ class MainWindow(QMainWindow):
     @staticmethod
     def _strip_wrapping_parentheses(text: str) -> str:
         value = (text or "").strip()
-        # Remove quote wrappers first so cases like '"(hello)"' normalize correctly.
-        quote_pairs = [
-            ('"', '"'),
-            ("'", "'"),
-            ("`", "`"),
-            ("“", "”"),
-            ("‘", "’"),
-        ]
-        changed = True
-        while changed and value:
-            changed = False
-            for left, right in quote_pairs:
-                if len(value) < 2 or not value.startswith(left) or not value.endswith(right):
-                    continue
-                inner = value[len(left):len(value) - len(right)].strip()
-                if not inner:
-                    continue
-                value = inner
-                changed = True
+        # Quote wrappers are removed before parentheses so cases like '"(hello)"'
+        # normalize correctly; quotes exposed by a paren peel are kept.
+        inside_parens = False
+        while len(value) >= 2:
+            opener = value[0]
+            closer = _WRAPPER_CLOSERS.get(opener)
+            if closer is None or value[-1] != closer:
                 break
-
-        paren_pairs = [
-            ("(", ")"),
-            ("（", "）"),
-        ]
-        changed = True
-        while changed and value:
-            changed = False
-            for left, right in paren_pairs:
-                if not MainWindow._is_wrapped_by_pair(value, left, right):
-                    continue
-                inner = value[len(left):len(value) - len(right)].strip()
-                if not inner:
-                    continue
-                value = inner
-                changed = True
+            if opener in _PAREN_CLOSERS:
+                if not MainWindow._is_wrapped_by_pair(value, opener, closer):
+                    break
+                inside_parens = True
+            elif inside_parens:
                 break
+            inner = value[1:-1].strip()
+            if not inner:
+                break
+            value = inner
         return value
 
     @staticmethod
     def _is_wrapped_by_pair(value: str, left: str, right: str) -> bool:
         if len(value) < 2 or not value.startswith(left) or not value.endswith(right):
             return False
+        left_count = value.count(left)
+        if left_count != value.count(right):
+            return False
+        if left_count == 1:
+            # The only brackets are the outer pair.
+            return True
         depth = 0
         for i, ch in enumerate(value):
             if ch == left:
@@ -1322,39 +1733,64 @@ class MainWindow(QMainWindow):
                     return False
         return depth == 0
 
+    @pyqtSlot()
     def _clear_output(self):
         self.text_output.clear()
-        self.statusBar().showMessage("Output cleared")
+        self._show_status("Output cleared")
 
+    @pyqtSlot()
     def _focus_output_for_edit(self):
         self.text_output.setFocus()
         cursor = self.text_output.textCursor()
         cursor.movePosition(cursor.MoveOperation.End)
         self.text_output.setTextCursor(cursor)
-        self.statusBar().showMessage("Output ready for editing")
+        self._show_status("Output ready for editing")
 
     def _append_output_text(self, text: str):
-        text = (text or "").strip()
+        text = text or ""
+        if text and (text[0].isspace() or text[-1].isspace()):
+            # Transcriptions normally arrive trimmed; only copy when padding is present.
+            text = text.strip()
         if not text:
             return
-        current = self.text_output.toPlainText().strip()
-        if current:
-            self.text_output.setPlainText(f"{current}\n{text}")
-        else:
-            self.text_output.setPlainText(text)
+        current = self._output_text()
+        if current and (current[0].isspace() or current[-1].isspace()):
+            # Hand-edited padding is trimmed by a full rewrite, as before.
+            current = current.strip()
+            combined = f"{current}\n{text}" if current else text
+            self.text_output.setPlainText(combined)
+            self._output_text_cache = combined
+            return
+        # Lays out only the new block, keeps the user's cursor, and follows the
+        # tail only when the view was already scrolled to the bottom.
+        self.text_output.appendPlainText(text)
+        self._output_text_cache = f"{current}\n{text}" if current else text
+
+    @pyqtSlot()
+    def _invalidate_output_text(self):
+        self._output_text_cache = None
+
+    def _output_text(self) -> str:
+        """Return the output editor text, converting from Qt only after edits."""
+        if self._output_text_cache is None:
+            self._output_text_cache = self.text_output.toPlainText()
+        return self._output_text_cache
 
     # ── Tray / Window ──────────────────────────────────────────────
 
+    @pyqtSlot()
     def show_and_focus(self):
         self.showNormal()
         self.raise_()
         self.activateWindow()
 
+    @pyqtSlot()
     def toggle_listening_from_external(self):
         self.show_and_focus()
         self.tabs.setCurrentIndex(0)  # Capture tab
         self.btn_listen_toggle.click()
 
+    @pyqtSlot()
     def toggle_recording_from_external(self):
         self.show_and_focus()
         self.tabs.setCurrentIndex(0)  # Capture tab
@@ -1365,7 +1801,7 @@ class MainWindow(QMainWindow):
 
     def _minimize_to_tray(self):
         self.hide()
-        self.statusBar().showMessage("Running in tray")
+        self._show_status("Running in tray")
         if self.tray:
             self.tray.showMessage(
                 "ZestVoice",
@@ -1374,217 +1810,104 @@ class MainWindow(QMainWindow):
                 2500,
             )
 
+    @pyqtSlot(int)
+    def _on_tab_changed(self, _index: int):
+        if self.tabs.currentWidget() is self.tts_panel:
+            self._resume_tts_playback_ui()
+        else:
+            self._tts_ui_timer.stop()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._resume_tts_playback_ui()
+
+    def hideEvent(self, event):
+        self._tts_ui_timer.stop()
+        super().hideEvent(event)
+
+    @pyqtSlot(int, int)
     def _on_splitter_moved(self, _pos, _index):
+        # A drag emits splitterMoved per mouse move; persist only the final sizes.
+        self._splitter_save_timer.start()
+
+    @pyqtSlot()
+    def _flush_splitter_sizes(self):
+        self._splitter_save_timer.stop()
         if self._on_ui_settings_changed:
             sizes = self.main_splitter.sizes()
             self._on_ui_settings_changed({"ui_splitter_sizes": f"{sizes[0]},{sizes[1]}"})
 
     @staticmethod
     def _is_server_failure_message(err: str) -> bool:
-        msg = str(err or "").lower()
-        signals = (
-            "http",
-            "timeout",
-            "timed out",
-            "connection",
-            "request failed",
-            "status code",
-            "server",
-            "captured audio was saved",
-            "source audio was saved",
-        )
-        return any(token in msg for token in signals)
+        return _SERVER_FAILURE_RE.search(str(err or "")) is not None
 
     def _set_server_status(self, online: bool, detail: str = ""):
         self._server_online = bool(online)
-        icon_key = "listening_server_status"
-        if self._server_online:
-            tooltip = "Server: Connected"
-            bg = "#6a9a81" if not self.dark_mode else "#4f7a68"
-            border = "#58826d" if not self.dark_mode else "#456a5a"
-        else:
-            icon_key = "listening_server_offline"
-            tooltip = "Server Offline - Stop Speaking"
-            bg = "#b87474" if not self.dark_mode else "#9a6262"
-            border = "#9f6464" if not self.dark_mode else "#865656"
+        tooltip = "Server: Connected" if self._server_online else "Server Offline - Stop Speaking"
         if detail:
             tooltip = f"{tooltip}\n{detail}"
-        self.btn_server_state.setIcon(ui_icon(self, icon_key))
         self.btn_server_state.setToolTip(tooltip)
+        state = (self._server_online, self.dark_mode)
+        if state == self._server_status_state:
+            # Repeated health updates only change the tooltip detail.
+            return
+        self._server_status_state = state
+        icon_key = "listening_server_status" if self._server_online else "listening_server_offline"
+        self.btn_server_state.setIcon(ui_icon(self, icon_key))
+        palette = self._palette
         self.btn_server_state.setStyleSheet(
-            f"""
-            QToolButton {{
-                background: {bg};
-                border: 1px solid {border};
-                border-radius: 6px;
-                padding: 4px;
-            }}
-            """
+            palette.server_online_qss if self._server_online else palette.server_offline_qss
         )
 
     def _sync_retry_last_failed_button(self):
         enabled = self.stt_service.has_last_failed_capture()
+        state = (enabled, self.dark_mode)
+        if state == self._retry_button_state:
+            return
+        self._retry_button_state = state
         self.btn_retry_last_failed.setEnabled(enabled)
-        if enabled:
-            bg = "#6a86a3" if not self.dark_mode else "#5e738b"
-            hover = "#7893af" if not self.dark_mode else "#6b8199"
-            border = "#5c7893" if not self.dark_mode else "#51657c"
-        else:
-            bg = "#b0bfcd" if not self.dark_mode else "#4a5868"
-            hover = bg
-            border = "#9fb0c0" if not self.dark_mode else "#425060"
+        palette = self._palette
         self.btn_retry_last_failed.setStyleSheet(
-            f"""
-            QToolButton {{
-                background: {bg};
-                border: 1px solid {border};
-                border-radius: 6px;
-                padding: 4px;
-            }}
-            QToolButton:hover {{
-                background: {hover};
-            }}
-            """
+            palette.retry_enabled_qss if enabled else palette.retry_disabled_qss
         )
 
+    @pyqtSlot()
     def _retry_last_failed_transcription(self):
         if not self.stt_service.retry_last_failed():
-            self.statusBar().showMessage("No failed transcription available to retry")
+            self._show_status("No failed transcription available to retry")
             self._sync_retry_last_failed_button()
             return
-        self.statusBar().showMessage("Recreating last failed message...")
+        self._show_status("Recreating last failed message...")
 
     def _set_listening_button_style(self, listening: bool):
-        if listening:
-            base = "#8f3b3b" if not self.dark_mode else "#7a3030"
-            hover = "#a14848" if not self.dark_mode else "#8b3737"
-            pressed = "#7a3030" if not self.dark_mode else "#682626"
-        else:
-            base = "#a97845" if not self.dark_mode else "#986e43"
-            hover = "#b78451" if not self.dark_mode else "#a77c4f"
-            pressed = "#93673b" if not self.dark_mode else "#845f39"
-        self._apply_button_palette(
-            self.btn_listen_toggle,
-            base=base,
-            hover=hover,
-            pressed=pressed,
-        )
-        if hasattr(self, "btn_quick_listen"):
-            self._apply_button_palette(
-                self.btn_quick_listen,
-                base=base,
-                hover=hover,
-                pressed=pressed,
-            )
-
-    def _set_recording_button_styles(self, recording: bool):
-        if not hasattr(self, "btn_rec_start"):
-            return
-        if self.dark_mode:
-            start_base, start_hover, start_pressed = "#5a7f70", "#6a8f7f", "#4e6f63"
-            pause_base, pause_hover, pause_pressed = "#4f7264", "#5d8474", "#456558"
-            stop_base, stop_hover, stop_pressed = "#a26666", "#b27575", "#8d5858"
-            disabled_bg, disabled_fg = "#445160", "#bcc8d8"
-        else:
-            start_base, start_hover, start_pressed = "#5f8873", "#6e9782", "#527762"
-            pause_base, pause_hover, pause_pressed = "#557b69", "#638975", "#4a6c5c"
-            stop_base, stop_hover, stop_pressed = "#b06a6a", "#bf7878", "#9a5d5d"
-            disabled_bg, disabled_fg = "#cfd8e2", "#6b7786"
-        self._apply_button_palette(
-            self.btn_rec_start,
-            base=start_base,
-            hover=start_hover,
-            pressed=start_pressed,
-            disabled_bg=disabled_bg,
-            disabled_text=disabled_fg,
-        )
-        self._apply_button_palette(
-            self.btn_rec_pause,
-            base=pause_base,
-            hover=pause_hover,
-            pressed=pause_pressed,
-            disabled_bg=disabled_bg,
-            disabled_text=disabled_fg,
-        )
-        self._apply_button_palette(
-            self.btn_rec_stop,
-            base=stop_base,
-            hover=stop_hover,
-            pressed=stop_pressed,
-            disabled_bg=disabled_bg,
-            disabled_text=disabled_fg,
-        )
-
-    def _set_file_button_styles(self):
-        if not hasattr(self, "btn_select_file"):
-            return
-        if self.dark_mode:
-            select_base, select_hover, select_pressed = "#6f7f57", "#7d8e64", "#5f6d4a"
-            trans_base, trans_hover, trans_pressed = "#5e7d67", "#6d8c76", "#506b59"
-            disabled_bg, disabled_fg = "#445160", "#bcc8d8"
-        else:
-            select_base, select_hover, select_pressed = "#718a58", "#7f9965", "#60764a"
-            trans_base, trans_hover, trans_pressed = "#5f8872", "#6f9781", "#517764"
-            disabled_bg, disabled_fg = "#cfd8e2", "#6b7786"
-        self._apply_button_palette(
-            self.btn_select_file,
-            base=select_base,
-            hover=select_hover,
-            pressed=select_pressed,
-        )
-        self._apply_button_palette(
-            self.btn_transcribe_file,
-            base=trans_base,
-            hover=trans_hover,
-            pressed=trans_pressed,
-            disabled_bg=disabled_bg,
-            disabled_text=disabled_fg,
-        )
-
-    def _refresh_capture_button_styles(self):
-        self._set_listening_button_style(self.stt_service.is_listening())
-        self._set_recording_button_styles(self.stt_service.is_recording)
-        self._set_file_button_styles()
-
-    @staticmethod
-    def _apply_button_palette(
-        button: QPushButton,
-        *,
-        base: str,
-        hover: str,
-        pressed: str,
-        text: str = "#ffffff",
-        disabled_bg: Optional[str] = None,
-        disabled_text: str = "#ffffff",
-    ):
-        disabled_bg = disabled_bg or base
-        button.setStyleSheet(
-            f"""
-            QPushButton {{
-                background: {base};
-                color: {text};
-                border: none;
-                border-radius: 6px;
-                padding: 6px 10px;
-            }}
-            QPushButton:hover {{ background: {hover}; }}
-            QPushButton:pressed {{ background: {pressed}; }}
-            QPushButton:disabled {{
-                background: {disabled_bg};
-                color: {disabled_text};
-            }}
-            """
-        )
+        state = "active" if listening else "idle"
+        for button in (self.btn_listen_toggle, self.btn_quick_listen):
+            if button is None or button.property("state") == state:
+                continue
+            button.setProperty("state", state)
+            # Property selectors are only re-evaluated on repolish.
+            button.style().unpolish(button)
+            button.style().polish(button)
 
     def _update_minimum_width_for_tabs(self):
         """Set window minimum width so all top tabs stay fully visible."""
-        self.ensurePolished()
         tab_bar = self.tabs.tabBar()
         tab_count = tab_bar.count()
         if tab_count <= 0:
             return
+        # Both theme stylesheets share tab metrics, so theme toggles reuse the cached width.
+        cache_key = (
+            tuple(tab_bar.tabText(i) for i in range(tab_count)),
+            self.font().key(),
+            self.devicePixelRatio(),
+        )
+        if cache_key == self._min_width_cache_key:
+            self.setMinimumWidth(self._min_width_cache_value)
+            return
 
-        tab_total = sum(tab_bar.tabSizeHint(i).width() for i in range(tab_count))
+        self.ensurePolished()
+        # sizeHint() spans every tab at its full hint; tabSizeHint() is protected in PyQt6.
+        tab_total = tab_bar.sizeHint().width()
         if tab_total <= 0:
             return
 
@@ -1603,93 +1926,29 @@ class MainWindow(QMainWindow):
 
         # Small buffer for frame/chrome and minor style variance.
         calculated_min_width = tab_total + tab_spacing_total + margins_total + 36
-        self.setMinimumWidth(max(560, calculated_min_width))
+        self._min_width_cache_key = cache_key
+        self._min_width_cache_value = max(560, calculated_min_width)
+        self.setMinimumWidth(self._min_width_cache_value)
+
+    @property
+    def _palette(self) -> _ThemePalette:
+        return _DARK_THEME if self.dark_mode else _LIGHT_THEME
+
+    @pyqtSlot()
+    def _apply_initial_theme(self):
+        if not self._theme_applied:
+            self._apply_theme()
 
     def _apply_theme(self):
-        if self.dark_mode:
-            stylesheet = """
-            QMainWindow { background: #12161c; }
-            QTabWidget::pane { border: 1px solid #303b49; background: #1a1f27; border-radius: 8px; }
-            QTabBar::tab {
-                background: #222a34;
-                color: #cfd7e4;
-                border: 1px solid #303b49;
-                padding: 6px 12px;
-                margin-right: 4px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-            }
-            QTabBar::tab:selected { background: #2b3442; border-bottom-color: #2b3442; color: #eef3f8; }
-            QScrollArea#settingsScrollArea { background: #1a1f27; border: none; }
-            QScrollArea#settingsScrollArea > QWidget#qt_scrollarea_viewport { background: #1a1f27; }
-            QWidget#settingsScrollContent { background: #1a1f27; }
-            QTextEdit, QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {
-                border: 1px solid #3a4554;
-                border-radius: 6px;
-                padding: 4px;
-                background: #131922;
-                color: #dce5f2;
-            }
-            QPushButton { background: #5a6d84; color: #f2f6fb; border: none; border-radius: 6px; padding: 6px 10px; }
-            QPushButton:hover { background: #667a92; }
-            QPushButton:pressed { background: #4d6076; }
-            QToolButton[role="tts-adjust"] {
-                background: #3a4656;
-                color: #9fb0c3;
-                border: 1px solid #4a5a6d;
-                border-radius: 6px;
-                padding: 4px 8px;
-                min-width: 22px;
-            }
-            QToolButton[role="tts-adjust"]:enabled {
-                background: #9a7a53;
-                color: #f6efe6;
-                border: 1px solid #ad8b64;
-            }
-            QToolButton[role="tts-adjust"]:enabled:hover { background: #a88964; }
-            QToolButton[role="tts-adjust"]:enabled:pressed { background: #856947; }
-            QLabel { color: #cfd7e4; }
-            QCheckBox { color: #cfd7e4; }
-            QStatusBar { background: #1a1f27; color: #cfd7e4; border-top: 1px solid #303b49; }
-            """
-        else:
-            stylesheet = """
-            QMainWindow { background: #f3f7fb; }
-            QTabWidget::pane { border: 1px solid #c8d6e5; background: #ffffff; border-radius: 8px; }
-            QTabBar::tab { background: #dfeaf4; border: 1px solid #b8cadb; padding: 6px 12px; margin-right: 4px; border-top-left-radius: 6px; border-top-right-radius: 6px; }
-            QTabBar::tab:selected { background: #ffffff; border-bottom-color: #ffffff; }
-            QScrollArea#settingsScrollArea { background: #ffffff; border: none; }
-            QScrollArea#settingsScrollArea > QWidget#qt_scrollarea_viewport { background: #ffffff; }
-            QWidget#settingsScrollContent { background: #ffffff; }
-            QTextEdit, QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {
-                border: 1px solid #b8cadb;
-                border-radius: 6px;
-                padding: 4px;
-                background: #fbfdff;
-            }
-            QPushButton { background: #2f6d9a; color: #ffffff; border: none; border-radius: 6px; padding: 6px 10px; }
-            QPushButton:hover { background: #3c7cab; }
-            QPushButton:pressed { background: #285f86; }
-            QToolButton[role="tts-adjust"] {
-                background: #e7eef6;
-                color: #1f3b53;
-                border: 1px solid #b8cadb;
-                border-radius: 6px;
-                padding: 4px 8px;
-                min-width: 22px;
-            }
-            QToolButton[role="tts-adjust"]:enabled:hover { background: #d7e5f3; }
-            QToolButton[role="tts-adjust"]:enabled:pressed { background: #c7daec; }
-            QLabel { color: #1f3b53; }
-            QCheckBox { color: #1f3b53; }
-            """
-        self.setStyleSheet(stylesheet)
-        self._refresh_capture_button_styles()
+        self._theme_applied = True
+        self.setStyleSheet(self._palette.window_qss)
         self._update_minimum_width_for_tabs()
 
     def closeEvent(self, event):
         self._tts_ui_timer.stop()
-        self.tts_playback.close()
+        self._flush_pending_saves()
+        if self.tts_playback is not None:
+            self.tts_playback.close()
         event.accept()
         app = QApplication.instance()
         if app:
@@ -102,12 +102,6 @@ class SettingsPanel(QWidget):
         vad_aggressiveness=None,
         vad_min_speech_seconds=None,
     ):
-        self._set_combo_value(self.input_stt_language, language)
-        self._set_combo_value(self.input_stt_response_format, response_format)
-        self.chk_auto_copy_transcription.setChecked(auto_copy)
-        self.chk_clear_output_after_copy.setChecked(bool(clear_output_after_copy))
-        self.chk_stop_listening_after_copy.setChecked(bool(stop_listening_after_copy))
-        self.chk_keep_wrapping_parentheses.setChecked(bool(keep_wrapping_parentheses))
         aggr = self._clamp_aggressiveness(vad_aggressiveness if vad_aggressiveness is not None else VAD_AGGRESSIVENESS)
         min_speech = self._clamp_min_speech(
             vad_min_speech_seconds if vad_min_speech_seconds is not None else VAD_MIN_SPEECH_SECONDS
@@ -116,22 +110,37 @@ class SettingsPanel(QWidget):
             noise = self._estimate_noise_level(aggr, min_speech)
         else:
             noise = self._clamp_noise(vad_noise_level)
-        self._updating_vad_controls = True
-        self.slider_vad_noise.setValue(noise)
-        self.input_vad_aggressiveness.setValue(aggr)
-        self.input_vad_min_speech_seconds.setValue(min_speech)
-        self._updating_vad_controls = False
-        self._update_vad_summary()
+        # Apply every control in one pass so the page relayouts once.
+        self.setUpdatesEnabled(False)
+        try:
+            self._set_combo_value(self.input_stt_language, language)
+            self._set_combo_value(self.input_stt_response_format, response_format)
+            self.chk_auto_copy_transcription.setChecked(auto_copy)
+            self.chk_clear_output_after_copy.setChecked(bool(clear_output_after_copy))
+            self.chk_stop_listening_after_copy.setChecked(bool(stop_listening_after_copy))
+            self.chk_keep_wrapping_parentheses.setChecked(bool(keep_wrapping_parentheses))
+            self._updating_vad_controls = True
+            self.slider_vad_noise.setValue(noise)
+            self.input_vad_aggressiveness.setValue(aggr)
+            self.input_vad_min_speech_seconds.setValue(min_speech)
+            self._updating_vad_controls = False
+            self._update_vad_summary()
+        finally:
+            self.setUpdatesEnabled(True)
         self._emit_stt_settings(show_status=False)
 
     def apply_tts_settings(self, model: str, voice: str, language: str, response_format: str, speed: str):
+        self.setUpdatesEnabled(False)
         self._updating_tts_controls = True
-        self._set_combo_value(self.input_tts_model, model)
-        self._set_voice_combo_value(voice)
-        self._set_combo_value(self.input_tts_language, language)
-        self._set_combo_value(self.input_tts_response_format, response_format)
-        self.input_tts_speed.setValue(self._coerce_tts_speed(speed))
-        self._updating_tts_controls = False
+        try:
+            self._set_combo_value(self.input_tts_model, model)
+            self._set_voice_combo_value(voice)
+            self._set_combo_value(self.input_tts_language, language)
+            self._set_combo_value(self.input_tts_response_format, response_format)
+            self.input_tts_speed.setValue(self._coerce_tts_speed(speed))
+        finally:
+            self._updating_tts_controls = False
+            self.setUpdatesEnabled(True)
         self._emit_tts_settings(show_status=False, silent=True)
 
     def set_tts_speed_value(self, speed: float, emit: bool = False):
@@ -460,9 +469,7 @@ class SettingsPanel(QWidget):
         filter_lang_row = QHBoxLayout()
         filter_lang_row.addWidget(QLabel("Preset Language:"))
         self.combo_voice_filter_language = QComboBox()
-        self.combo_voice_filter_language.addItem("Any")
-        for code in self._voice_languages():
-            self.combo_voice_filter_language.addItem(code)
+        self.combo_voice_filter_language.addItems(["Any", *self._voice_languages()])
         self.combo_voice_filter_language.currentTextChanged.connect(self._refresh_voice_actor_options)
         filter_lang_row.addWidget(self.combo_voice_filter_language)
         layout.addLayout(filter_lang_row)
@@ -747,8 +754,7 @@ class SettingsPanel(QWidget):
         current = self.combo_profiles.currentText().strip() if hasattr(self, "combo_profiles") else ""
         self.combo_profiles.blockSignals(True)
         self.combo_profiles.clear()
-        for profile in self._profiles:
-            self.combo_profiles.addItem(profile["name"])
+        self.combo_profiles.addItems([profile["name"] for profile in self._profiles])
         idx = self.combo_profiles.findText(current)
         self.combo_profiles.setCurrentIndex(idx if idx >= 0 else 0)
         self.combo_profiles.blockSignals(False)
@@ -884,8 +890,7 @@ class SettingsPanel(QWidget):
         current = self.combo_tts_profiles.currentText().strip() if hasattr(self, "combo_tts_profiles") else ""
         self.combo_tts_profiles.blockSignals(True)
         self.combo_tts_profiles.clear()
-        for profile in self._tts_profiles:
-            self.combo_tts_profiles.addItem(profile["name"])
+        self.combo_tts_profiles.addItems([profile["name"] for profile in self._tts_profiles])
         idx = self.combo_tts_profiles.findText(current)
         self.combo_tts_profiles.setCurrentIndex(idx if idx >= 0 else 0)
         self.combo_tts_profiles.blockSignals(False)
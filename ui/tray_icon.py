@@ -29,12 +29,8 @@ def _select_logo_path() -> Path | None:
     return None
 
 
-def _make_logo_icon(path: Path | None, badge_color: str | None = None) -> QIcon:
-    if path is None:
-        return QIcon()
-
-    source = QPixmap(str(path))
-    if source.isNull():
+def _make_logo_icon(source: QPixmap | None, badge_color: str | None = None) -> QIcon:
+    if source is None or source.isNull():
         return QIcon()
 
     size = 64
@@ -68,10 +64,12 @@ class TrayIcon(QSystemTrayIcon):
     """System tray icon with context menu for the transcriber app."""
 
     def __init__(self, parent=None):
+        # Decode the logo once and derive every state icon from it.
         logo_path = _select_logo_path()
-        idle = _make_logo_icon(logo_path)
-        listening = _make_logo_icon(logo_path, badge_color="#00c853")
-        recording = _make_logo_icon(logo_path, badge_color="#ff1744")
+        logo = QPixmap(str(logo_path)) if logo_path is not None else None
+        idle = _make_logo_icon(logo)
+        listening = _make_logo_icon(logo, badge_color="#00c853")
+        recording = _make_logo_icon(logo, badge_color="#ff1744")
 
         # Keep robust defaults if assets are missing or unreadable.
         self._icons = {
@@ -27,6 +27,8 @@ class TTSPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._duration_seconds = 0.0
+        self._position_ms = 0
+        self._playing = False
         self._slider_tracking = False
         self._updating_profile_combo = False
 
@@ -223,8 +225,7 @@ class TTSPanel(QWidget):
         names = [str(p.get("name", "")).strip() for p in profiles if isinstance(p, dict) and str(p.get("name", "")).strip()]
         self._updating_profile_combo = True
         self.combo_tts_profiles.clear()
-        for name in names:
-            self.combo_tts_profiles.addItem(name)
+        self.combo_tts_profiles.addItems(names)
         idx = self.combo_tts_profiles.findText(active_name)
         self.combo_tts_profiles.setCurrentIndex(idx if idx >= 0 else 0)
         self.combo_tts_profiles.setEnabled(bool(names))
@@ -262,21 +263,34 @@ class TTSPanel(QWidget):
             self.set_duration(0.0)
             self.set_position(0.0)
 
+    # The playback timer pushes state several times a second; skip unchanged values.
+
     def set_playing(self, playing: bool):
+        playing = bool(playing)
+        if playing == self._playing:
+            return
+        self._playing = playing
         self.btn_play_pause.setText("Pause" if playing else "Play")
 
     def set_duration(self, seconds: float):
-        self._duration_seconds = max(0.0, float(seconds))
+        seconds = max(0.0, float(seconds))
+        if seconds == self._duration_seconds:
+            return
+        self._duration_seconds = seconds
         self.slider_position.setRange(0, int(round(self._duration_seconds * 1000)))
         self.lbl_duration.setText(self._format_mm_ss(self._duration_seconds))
 
     def set_position(self, seconds: float):
         position = max(0.0, min(self._duration_seconds, float(seconds)))
+        position_ms = int(round(position * 1000))
+        if position_ms == self._position_ms:
+            return
+        self._position_ms = position_ms
         self.lbl_position.setText(self._format_mm_ss(position))
         if self._slider_tracking:
             return
         self.slider_position.blockSignals(True)
-        self.slider_position.setValue(int(round(position * 1000)))
+        self.slider_position.setValue(position_ms)
         self.slider_position.blockSignals(False)
 
     def get_playback_speed(self) -> float: